@@ -1,15 +1,34 @@
 """Parse Claude Code's stats-cache.json and session files."""
-import json
+import mmap
+import os
 import socket
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from collections import defaultdict
+from functools import lru_cache
+
+try:
+    # orjson parses the many small JSONL documents ~5x faster than stdlib
+    # and accepts bytes directly, skipping per-line UTF-8 decode.
+    from orjson import (
+        JSONDecodeError as _JSONDecodeError,
+        dumps as _json_dumps,
+        loads as _json_loads,
+    )
+except ImportError:
+    from json import JSONDecodeError as _JSONDecodeError
+    from json import dumps as _stdlib_dumps, loads as _json_loads
+
+    def _json_dumps(obj) -> bytes:
+        return _stdlib_dumps(obj, separators=(",", ":")).encode()
 
 from .config import load_config
 
 STATS_CACHE_PATH = Path.home() / ".claude" / "stats-cache.json"
 CLAUDE_PROJECTS_PATH = Path.home() / ".claude" / "projects"
+SCAN_CACHE_PATH = Path.home() / ".claude" / ".forge-scan-cache.json"
 PROTOCOL_VERSION = 1
 
 
@@ -22,18 +41,35 @@ def _utc_timestamp_to_local_date(timestamp: str) -> str:
     return dt.astimezone().strftime("%Y-%m-%d")
 
 
+_stats_cache: Optional[tuple] = None  # (mtime_ns, parsed dict)
+
+
 def load_stats_cache() -> Optional[dict]:
-    """Load and parse ~/.claude/stats-cache.json."""
-    if not STATS_CACHE_PATH.exists():
+    """Load and parse ~/.claude/stats-cache.json.
+
+    The parse is cached and revalidated by mtime, so the repeated
+    get_local_* calls within one invocation share a single disk read and
+    JSON decode unless the file changed underneath us.
+    """
+    global _stats_cache
+    try:
+        mtime_ns = STATS_CACHE_PATH.stat().st_mtime_ns
+    except OSError:
+        _stats_cache = None
         return None
+    if _stats_cache is not None and _stats_cache[0] == mtime_ns:
+        return _stats_cache[1]
     try:
-        return json.loads(STATS_CACHE_PATH.read_text())
-    except (json.JSONDecodeError, IOError):
+        parsed = _json_loads(STATS_CACHE_PATH.read_bytes())
+    except (_JSONDecodeError, IOError):
         return None
+    _stats_cache = (mtime_ns, parsed)
+    return parsed
 
 
+@lru_cache(maxsize=1)
 def get_hostname() -> str:
-    """Get hostname from config or system."""
+    """Get hostname from config or system (cached per process)."""
     config = load_config()
     if config.get("hostname"):
         return config["hostname"]
@@ -80,62 +116,298 @@ def build_sync_payload(days: int = 365) -> dict:
     }
 
 
-def _get_daily_usage_from_sessions(days: int = 365) -> list[dict]:
-    """Parse session files for daily usage with full token breakdown."""
-    if not CLAUDE_PROJECTS_PATH.exists():
-        return []
+_TS_KEY = b'"timestamp":"'
+_MODEL_KEY = b'"model":"'
+_USAGE_KEY = b'"usage":{'
 
-    cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
 
-    # Aggregate by date
-    daily_data = defaultdict(lambda: {
-        "input_tokens": 0,
-        "output_tokens": 0,
-        "cache_read_tokens": 0,
-        "cache_creation_tokens": 0,
-    })
+def _extract_record(line: bytes) -> Optional[tuple]:
+    """Extract (timestamp, model, usage) straight from a compact JSON line.
 
-    for jsonl_file in CLAUDE_PROJECTS_PATH.glob("*/*.jsonl"):
-        try:
-            with open(jsonl_file, 'r') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line)
-                        if entry.get("type") != "assistant":
-                            continue
+    Session lines are dominated by message content we never look at, so a
+    full parse builds dicts for keys that are immediately discarded. This
+    slices out just the three fields (the key needles can't occur inside
+    JSON string values, where quotes are escaped) and hands only the small
+    usage object to the parser. Returns None whenever the line doesn't
+    match the expected shape; callers then fall back to a full parse.
+    """
+    msg = line.find(b'"message":{')
+    marker = line.find(b'"type":"assistant"')
+    if msg < 0 or marker < 0 or marker > msg:
+        return None
 
-                        message = entry.get("message", {})
-                        usage = message.get("usage", {})
-                        if not usage:
-                            continue
+    model = "unknown"
+    mk0 = line.find(_MODEL_KEY, msg)
+    if mk0 >= 0:
+        mk0 += len(_MODEL_KEY)
+        mk1 = line.find(b'"', mk0)
+        if mk1 < 0:
+            return None
+        model = line[mk0:mk1].decode()
+
+    u0 = line.rfind(_USAGE_KEY)
+    if u0 < 0:
+        # Without a usage span there is nothing safe to anchor the
+        # timestamp search on (the message body can contain nested
+        # "timestamp" keys in tool_use input); let the full parse
+        # handle these rare lines.
+        return None
 
-                        timestamp = entry.get("timestamp")
-                        if not timestamp:
-                            continue
+    # Walk to the usage object's matching close brace
+    start = u0 + len(_USAGE_KEY) - 1
+    depth = 1
+    pos = start + 1
+    while depth:
+        close = line.find(b'}', pos)
+        if close < 0:
+            return None
+        opened = line.find(b'{', pos, close)
+        if opened >= 0:
+            depth += 1
+            pos = opened + 1
+        else:
+            depth -= 1
+            pos = close + 1
 
-                        date = _utc_timestamp_to_local_date(timestamp)
-                        if date < cutoff:
-                            continue
+    try:
+        usage = _json_loads(line[start:pos])
+    except _JSONDecodeError:
+        return None
+
+    # The top-level timestamp comes after the message object, while any
+    # decoy "timestamp" key nested in tool_use input sits before the
+    # usage object (content precedes usage inside message) — so search
+    # only past the usage span. Not finding one there means the line
+    # doesn't have the expected layout; fall back rather than misdate.
+    ts0 = line.find(_TS_KEY, pos)
+    if ts0 < 0:
+        return None
+    ts0 += len(_TS_KEY)
+    ts1 = line.find(b'"', ts0)
+    # Sanity-check the shape so a stray match can't smuggle in a
+    # string that later blows up the date conversion
+    if ts1 < 0 or ts1 - ts0 < 10 or not line[ts0:ts0 + 4].isdigit():
+        return None
+    timestamp = line[ts0:ts1].decode()
+
+    return (timestamp, model, usage or None)
 
-                        daily_data[date]["input_tokens"] += usage.get("input_tokens", 0)
-                        daily_data[date]["output_tokens"] += usage.get("output_tokens", 0)
-                        daily_data[date]["cache_read_tokens"] += usage.get("cache_read_input_tokens", 0)
-                        daily_data[date]["cache_creation_tokens"] += usage.get("cache_creation_input_tokens", 0)
 
-                    except json.JSONDecodeError:
+def _scan_session_file(jsonl_file) -> list[tuple]:
+    """Scan one session JSONL file for assistant entries.
+
+    Returns (timestamp, model, usage) tuples where usage is the raw usage
+    dict, or None for assistant entries without usage data. Module-level so
+    it can be pickled and dispatched to worker processes.
+    """
+    records = []
+    # Locals for everything touched per line; LOAD_GLOBAL and attribute
+    # lookups add up across millions of iterations
+    append = records.append
+    extract = _extract_record
+    jloads = _json_loads
+    marker = b'"type":"assistant"'
+    try:
+        with open(jsonl_file, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped (and have nothing to scan)
+                return records
+            with mm:
+                find = mm.find
+                size = len(mm)
+                pos = 0
+                while pos < size:
+                    nl = find(b'\n', pos)
+                    end = size if nl < 0 else nl
+                    line_start = pos
+                    pos = size if nl < 0 else nl + 1
+                    # Only assistant entries contribute; skip the line
+                    # without even slicing it out of the map unless the
+                    # compact-JSON marker appears in the raw bytes
+                    if find(marker, line_start, end) < 0:
+                        continue
+                    line = mm[line_start:end]
+                    record = extract(line)
+                    if record is not None:
+                        append(record)
+                        continue
+                    # Fall back to a full parse for lines the specialized
+                    # extractor doesn't recognize
+                    try:
+                        entry = jloads(line)
+                    except _JSONDecodeError:
+                        continue
+                    eget = entry.get
+                    if eget("type") != "assistant":
                         continue
-        except (IOError, OSError):
+
+                    mget = eget("message", {}).get
+                    append((
+                        eget("timestamp"),
+                        mget("model", "unknown"),
+                        mget("usage") or None,
+                    ))
+    except (IOError, OSError):
+        pass
+    return records
+
+
+def _load_scan_cache() -> dict:
+    """Load the per-file scan cache, or an empty dict if missing/corrupt."""
+    if not SCAN_CACHE_PATH.exists():
+        return {}
+    try:
+        return _json_loads(SCAN_CACHE_PATH.read_bytes())
+    except (_JSONDecodeError, IOError):
+        return {}
+
+
+def _save_scan_cache(cache: dict) -> None:
+    """Write the scan cache back; best-effort, failures are non-fatal."""
+    try:
+        SCAN_CACHE_PATH.write_bytes(_json_dumps(cache))
+    except (IOError, OSError):
+        pass
+
+
+@lru_cache(maxsize=1)
+def _scan_sessions() -> list:
+    """Scan every session file once per process.
+
+    One CLI invocation can hit several aggregators (build_sync_payload plus
+    the stats renderers); they all project from this single memoized pass
+    instead of each re-reading every file.
+    """
+    return list(_iter_session_scans())
+
+
+def _iter_jsonl_files():
+    """Yield a DirEntry for each session JSONL file.
+
+    Nested os.scandir keeps the traversal on raw DirEntry objects, whose
+    cached stat avoids the extra per-file syscalls Path.glob would incur.
+    """
+    try:
+        project_dirs = os.scandir(CLAUDE_PROJECTS_PATH)
+    except OSError:
+        return
+    with project_dirs:
+        for project in project_dirs:
+            if not project.is_dir():
+                continue
+            try:
+                entries = os.scandir(project.path)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name.endswith(".jsonl") and entry.is_file():
+                        yield entry
+
+
+def _iter_session_scans():
+    """Yield (mtime, records) pairs from all session files.
+
+    The file mtime lets windowed aggregators skip whole files that cannot
+    contain rows inside their cutoff without touching the records at all.
+
+    Scan results are cached per file keyed by (mtime_ns, size), so repeated
+    runs (including the hourly sync hook) only re-parse files touched since
+    the last scan. Changed files are fanned out across a process pool;
+    parsing is pure-CPU and per-file independent, though with a single
+    changed file the pool overhead isn't worth it and we scan inline.
+    """
+    cache = _load_scan_cache()
+    paths = []
+    results = {}
+    keys = {}
+    mtimes = {}
+    changed = []
+
+    for dir_entry in _iter_jsonl_files():
+        path = dir_entry.path
+        paths.append(path)
+        try:
+            stat = dir_entry.stat()
+        except OSError:
+            results[path] = []
+            mtimes[path] = 0.0
             continue
+        mtimes[path] = stat.st_mtime
+        keys[path] = (stat.st_mtime_ns, stat.st_size)
+        entry = cache.get(path)
+        if (entry and entry.get("mtime_ns") == stat.st_mtime_ns
+                and entry.get("size") == stat.st_size):
+            results[path] = entry["records"]
+        else:
+            changed.append(path)
+
+    if len(changed) == 1:
+        results[changed[0]] = _scan_session_file(changed[0])
+    elif changed:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            scanned = executor.map(_scan_session_file, changed, chunksize=8)
+            for path, records in zip(changed, scanned):
+                results[path] = records
+
+    if changed:
+        _save_scan_cache({
+            path: {"mtime_ns": mtime_ns, "size": size, "records": results[path]}
+            for path, (mtime_ns, size) in keys.items()
+        })
+
+    for path in paths:
+        yield mtimes[path], results[path]
+
+
+def _get_daily_usage_from_sessions(days: int = 365) -> list[dict]:
+    """Parse session files for daily usage with full token breakdown."""
+    if not CLAUDE_PROJECTS_PATH.exists():
+        return []
+
+    cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    # Files untouched since before the window (minus a day of slack for the
+    # local-date cutoff) cannot contribute rows at or after the cutoff
+    mtime_cutoff = (datetime.now() - timedelta(days=days + 1)).timestamp()
+    # Raw ISO prefix one day before the cutoff: local dates differ from UTC
+    # by at most a day, so rows below this cannot land inside the window
+    # and skip the datetime conversion entirely
+    utc_reject = (datetime.now(timezone.utc) - timedelta(days=days + 1)).strftime('%Y-%m-%d')
+
+    # Aggregate by date: [input, output, cache_read, cache_creation]
+    daily_data = defaultdict(lambda: [0, 0, 0, 0])
+
+    for mtime, records in _scan_sessions():
+        if mtime < mtime_cutoff:
+            continue
+        for timestamp, _model, usage in records:
+            if not usage or not timestamp:
+                continue
+            if timestamp[:10] < utc_reject:
+                continue
+
+            date = _utc_timestamp_to_local_date(timestamp)
+            if date < cutoff:
+                continue
+
+            ug = usage.get
+            d = daily_data[date]
+            d[0] += ug("input_tokens", 0)
+            d[1] += ug("output_tokens", 0)
+            d[2] += ug("cache_read_input_tokens", 0)
+            d[3] += ug("cache_creation_input_tokens", 0)
 
     return [
         {
             "date": date,
-            "input_tokens": daily_data[date]["input_tokens"],
-            "output_tokens": daily_data[date]["output_tokens"],
-            "cache_read_tokens": daily_data[date]["cache_read_tokens"],
-            "cache_creation_tokens": daily_data[date]["cache_creation_tokens"],
+            "input_tokens": d[0],
+            "output_tokens": d[1],
+            "cache_read_tokens": d[2],
+            "cache_creation_tokens": d[3],
         }
-        for date in sorted(daily_data.keys())
+        for date, d in sorted(daily_data.items())
     ]
 
 
@@ -193,8 +465,28 @@ def get_local_daily_stats(days: int = 30) -> list[dict]:
         if entry["date"] >= cutoff:
             tokens_map[entry["date"]] = sum(entry.get("tokensByModel", {}).values())
 
-    # Combine
-    all_dates = sorted(set(activity_map.keys()) | set(tokens_map.keys()))
+    # Combine: both maps preserve the stats-cache's date order, so a
+    # two-pointer merge of the key sequences replaces set-union + sort
+    a_dates = list(activity_map)
+    t_dates = list(tokens_map)
+    all_dates = []
+    i = j = 0
+    while i < len(a_dates) and j < len(t_dates):
+        a, t = a_dates[i], t_dates[j]
+        if a == t:
+            all_dates.append(a)
+            i += 1
+            j += 1
+        elif a < t:
+            all_dates.append(a)
+            i += 1
+        else:
+            all_dates.append(t)
+            j += 1
+    all_dates.extend(a_dates[i:])
+    all_dates.extend(t_dates[j:])
+
+    hostname = get_hostname()
     result = []
     for date in all_dates:
         activity = activity_map.get(date, {})
@@ -204,7 +496,7 @@ def get_local_daily_stats(days: int = 30) -> list[dict]:
             "message_count": activity.get("messageCount", 0),
             "session_count": activity.get("sessionCount", 0),
             "tool_call_count": activity.get("toolCallCount", 0),
-            "machines": [get_hostname()]
+            "machines": [hostname]
         })
 
     return result
@@ -221,67 +513,51 @@ def get_daily_stats_from_sessions(days: int = 30) -> list[dict]:
         return []
 
     cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    mtime_cutoff = (datetime.now() - timedelta(days=days + 1)).timestamp()
+    utc_reject = (datetime.now(timezone.utc) - timedelta(days=days + 1)).strftime('%Y-%m-%d')
 
-    # Aggregate by date
-    daily_data = defaultdict(lambda: {
-        "input_tokens": 0,
-        "output_tokens": 0,
-        "cache_read_tokens": 0,
-        "cache_creation_tokens": 0,
-        "message_count": 0,
-    })
-
-    # Find all session JSONL files
-    for jsonl_file in CLAUDE_PROJECTS_PATH.glob("*/*.jsonl"):
-        try:
-            with open(jsonl_file, 'r') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line)
-
-                        # Only process assistant messages with usage data
-                        if entry.get("type") != "assistant":
-                            continue
+    # Aggregate by date: [input, output, cache_read, cache_creation, messages]
+    daily_data = defaultdict(lambda: [0, 0, 0, 0, 0])
 
-                        message = entry.get("message", {})
-                        usage = message.get("usage", {})
-                        if not usage:
-                            continue
-
-                        timestamp = entry.get("timestamp")
-                        if not timestamp:
-                            continue
-
-                        date = _utc_timestamp_to_local_date(timestamp)
-                        if date < cutoff:
-                            continue
-
-                        daily_data[date]["input_tokens"] += usage.get("input_tokens", 0)
-                        daily_data[date]["output_tokens"] += usage.get("output_tokens", 0)
-                        daily_data[date]["cache_read_tokens"] += usage.get("cache_read_input_tokens", 0)
-                        daily_data[date]["cache_creation_tokens"] += usage.get("cache_creation_input_tokens", 0)
-                        daily_data[date]["message_count"] += 1
-
-                    except json.JSONDecodeError:
-                        continue
-        except (IOError, OSError):
+    for mtime, records in _scan_sessions():
+        if mtime < mtime_cutoff:
             continue
-
-    # Convert to list sorted by date
+        for timestamp, _model, usage in records:
+            # Only process assistant messages with usage data
+            if not usage or not timestamp:
+                continue
+            if timestamp[:10] < utc_reject:
+                continue
+
+            date = _utc_timestamp_to_local_date(timestamp)
+            if date < cutoff:
+                continue
+
+            ug = usage.get
+            d = daily_data[date]
+            d[0] += ug("input_tokens", 0)
+            d[1] += ug("output_tokens", 0)
+            d[2] += ug("cache_read_input_tokens", 0)
+            d[3] += ug("cache_creation_input_tokens", 0)
+            d[4] += 1
+
+    # Convert to list sorted by date. The sort stays here at emit: worker
+    # outputs merge into the date-keyed dict unordered, and there is at
+    # most one key per calendar day in the window, so this is the cheapest
+    # point to impose order. Rows are read-only, so they can all share one
+    # machines list instead of resolving the hostname per row
+    machines = [get_hostname()]
     result = []
-    for date in sorted(daily_data.keys()):
-        data = daily_data[date]
-        total = (data["input_tokens"] + data["output_tokens"] +
-                 data["cache_read_tokens"] + data["cache_creation_tokens"])
+    for date, d in sorted(daily_data.items()):
         result.append({
             "date": date,
-            "total_tokens": total,
-            "input_tokens": data["input_tokens"],
-            "output_tokens": data["output_tokens"],
-            "cache_read_tokens": data["cache_read_tokens"],
-            "cache_creation_tokens": data["cache_creation_tokens"],
-            "message_count": data["message_count"],
-            "machines": [get_hostname()]
+            "total_tokens": d[0] + d[1] + d[2] + d[3],
+            "input_tokens": d[0],
+            "output_tokens": d[1],
+            "cache_read_tokens": d[2],
+            "cache_creation_tokens": d[3],
+            "message_count": d[4],
+            "machines": machines
         })
 
     return result
@@ -296,103 +572,72 @@ def get_model_usage_from_sessions() -> list[dict]:
     if not CLAUDE_PROJECTS_PATH.exists():
         return []
 
-    # Aggregate by model
-    model_data = defaultdict(lambda: {
-        "input_tokens": 0,
-        "output_tokens": 0,
-        "cache_read_tokens": 0,
-        "cache_creation_tokens": 0,
-        "message_count": 0,
-    })
-
-    # Find all session JSONL files
-    for jsonl_file in CLAUDE_PROJECTS_PATH.glob("*/*.jsonl"):
-        try:
-            with open(jsonl_file, 'r') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line)
-
-                        # Only process assistant messages with usage data
-                        if entry.get("type") != "assistant":
-                            continue
-
-                        message = entry.get("message", {})
-                        usage = message.get("usage", {})
-                        if not usage:
-                            continue
-
-                        # Get model from message
-                        model = message.get("model", "unknown")
+    # Aggregate by model: [input, output, cache_read, cache_creation]
+    model_data = defaultdict(lambda: [0, 0, 0, 0])
 
-                        # Accumulate tokens
-                        model_data[model]["input_tokens"] += usage.get("input_tokens", 0)
-                        model_data[model]["output_tokens"] += usage.get("output_tokens", 0)
-                        model_data[model]["cache_read_tokens"] += usage.get("cache_read_input_tokens", 0)
-                        model_data[model]["cache_creation_tokens"] += usage.get("cache_creation_input_tokens", 0)
-                        model_data[model]["message_count"] += 1
+    for _mtime, records in _scan_sessions():
+        for _timestamp, model, usage in records:
+            # Only process assistant messages with usage data
+            if not usage:
+                continue
 
-                    except json.JSONDecodeError:
-                        continue
-        except (IOError, OSError):
-            continue
+            ug = usage.get
+            d = model_data[model]
+            d[0] += ug("input_tokens", 0)
+            d[1] += ug("output_tokens", 0)
+            d[2] += ug("cache_read_input_tokens", 0)
+            d[3] += ug("cache_creation_input_tokens", 0)
 
     # Convert to list
     return [
         {
             "model": model,
-            "input_tokens": data["input_tokens"],
-            "output_tokens": data["output_tokens"],
-            "cache_read_tokens": data["cache_read_tokens"],
-            "cache_creation_tokens": data["cache_creation_tokens"],
+            "input_tokens": d[0],
+            "output_tokens": d[1],
+            "cache_read_tokens": d[2],
+            "cache_creation_tokens": d[3],
         }
-        for model, data in sorted(model_data.items())
+        for model, d in sorted(model_data.items())
     ]
 
 
 def get_raw_usage_from_sessions(days: int = 365) -> list[dict]:
     """Extract raw per-message usage records with UTC timestamps."""
+    return list(_iter_raw_usage(days))
+
+
+def _iter_raw_usage(days: int):
+    """Yield raw usage rows lazily.
+
+    Raw usage is O(messages), the largest projection of the scan; yielding
+    rows keeps consumers from holding a second materialized copy alongside
+    the scan records until they actually need a list (the JSON boundary in
+    build_sync_payload still does).
+    """
     if not CLAUDE_PROJECTS_PATH.exists():
-        return []
+        return
 
     cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-    records = []
+    mtime_cutoff = (datetime.now() - timedelta(days=days + 1)).timestamp()
 
-    for jsonl_file in CLAUDE_PROJECTS_PATH.glob("*/*.jsonl"):
-        try:
-            with open(jsonl_file, 'r') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line)
-                        if entry.get("type") != "assistant":
-                            continue
-
-                        message = entry.get("message", {})
-                        usage = message.get("usage", {})
-                        if not usage:
-                            continue
-
-                        timestamp = entry.get("timestamp")
-                        if not timestamp:
-                            continue
-
-                        if _utc_timestamp_to_local_date(timestamp) < cutoff:
-                            continue
-
-                        records.append({
-                            "timestamp": timestamp,
-                            "model": message.get("model", "unknown"),
-                            "input_tokens": usage.get("input_tokens", 0),
-                            "output_tokens": usage.get("output_tokens", 0),
-                            "cache_read_tokens": usage.get("cache_read_input_tokens", 0),
-                            "cache_creation_tokens": usage.get("cache_creation_input_tokens", 0),
-                        })
-                    except json.JSONDecodeError:
-                        continue
-        except (IOError, OSError):
+    for mtime, file_records in _scan_sessions():
+        if mtime < mtime_cutoff:
             continue
+        for timestamp, model, usage in file_records:
+            if not usage or not timestamp:
+                continue
 
-    return records
+            if _utc_timestamp_to_local_date(timestamp) < cutoff:
+                continue
+
+            yield {
+                "timestamp": timestamp,
+                "model": model,
+                "input_tokens": usage.get("input_tokens", 0),
+                "output_tokens": usage.get("output_tokens", 0),
+                "cache_read_tokens": usage.get("cache_read_input_tokens", 0),
+                "cache_creation_tokens": usage.get("cache_creation_input_tokens", 0),
+            }
 
 
 def get_summary_from_sessions() -> dict:
@@ -400,28 +645,20 @@ def get_summary_from_sessions() -> dict:
     if not CLAUDE_PROJECTS_PATH.exists():
         return {}
 
-    total_messages = 0
-    total_sessions = 0
+    scans = _scan_sessions()
+    total_sessions = len(scans)
+    total_messages = sum(len(records) for _mtime, records in scans)
     first_date = None
 
-    for jsonl_file in CLAUDE_PROJECTS_PATH.glob("*/*.jsonl"):
-        total_sessions += 1
-        try:
-            with open(jsonl_file, 'r') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line)
-                        if entry.get("type") == "assistant":
-                            total_messages += 1
-                            timestamp = entry.get("timestamp")
-                            if timestamp:
-                                date = _utc_timestamp_to_local_date(timestamp)
-                                if first_date is None or date < first_date:
-                                    first_date = date
-                    except json.JSONDecodeError:
-                        continue
-        except (IOError, OSError):
-            continue
+    for _mtime, records in scans:
+        # Timestamps within a session file are monotonically increasing,
+        # so the first timestamped record is that file's earliest
+        for timestamp, _model, _usage in records:
+            if timestamp:
+                date = _utc_timestamp_to_local_date(timestamp)
+                if first_date is None or date < first_date:
+                    first_date = date
+                break
 
     return {
         "total_sessions": total_sessions,
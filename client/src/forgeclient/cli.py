@@ -13,6 +13,20 @@ from .local_cache import get_pending_count, list_pending, process_pending_syncs,
 from .display import console, render_daily_graph, render_recent_table, show_sync_status, show_stale_warning, render_model_usage
 
 
+def setup_io():
+    """Block-buffer stdout when it isn't a terminal.
+
+    POSIX already block-buffers piped stdout, but Windows consoles and
+    some wrappers leave it line- or unbuffered, turning every rendered
+    line into its own write syscall.
+    """
+    try:
+        if not sys.stdout.isatty():
+            sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError, OSError):
+        pass
+
+
 def setup_logging(verbose: bool):
     level = logging.DEBUG if verbose else logging.WARNING
     logging.basicConfig(
@@ -26,6 +40,7 @@ def setup_logging(verbose: bool):
 @click.option('--verbose', '-v', is_flag=True, help='Enable debug logging')
 def cli(verbose: bool):
     """Forge - Claude Code usage tracker."""
+    setup_io()
     setup_logging(verbose)
 
 
@@ -71,30 +86,36 @@ FORGE_HOOK = {
 }
 
 
-def is_hook_installed() -> bool:
-    """Check if the forge sync hook is already installed."""
+def _load_settings() -> dict:
+    """Load Claude's settings.json, or an empty dict if missing/corrupt."""
     if not CLAUDE_SETTINGS_PATH.exists():
-        return False
+        return {}
     try:
-        settings = json.loads(CLAUDE_SETTINGS_PATH.read_text())
-        hooks = settings.get("hooks", {}).get("UserPromptSubmit", [])
-        for matcher in hooks:
-            for hook in matcher.get("hooks", []):
-                if hook.get("command", "").startswith("forge sync"):
-                    return True
+        return json.loads(CLAUDE_SETTINGS_PATH.read_text())
     except (json.JSONDecodeError, IOError):
-        pass
+        return {}
+
+
+def is_hook_installed(settings: dict | None = None) -> bool:
+    """Check if the forge sync hook is already installed.
+
+    Pass pre-loaded settings to avoid re-reading settings.json when the
+    caller already holds them (as setup does).
+    """
+    if settings is None:
+        settings = _load_settings()
+    for matcher in settings.get("hooks", {}).get("UserPromptSubmit", []):
+        for hook in matcher.get("hooks", []):
+            if hook.get("command", "").startswith("forge sync"):
+                return True
     return False
 
 
-def install_hook() -> bool:
+def install_hook(settings: dict | None = None) -> bool:
     """Install the forge sync hook into Claude settings. Returns success."""
     try:
-        # Load existing settings or create new
-        if CLAUDE_SETTINGS_PATH.exists():
-            settings = json.loads(CLAUDE_SETTINGS_PATH.read_text())
-        else:
-            settings = {}
+        if settings is None:
+            settings = _load_settings()
 
         # Ensure hooks structure exists
         if "hooks" not in settings:
@@ -179,12 +200,13 @@ def setup():
         else:
             return  # Don't offer hook installation if config not saved
 
-    # Offer to install Claude hook
+    # Offer to install Claude hook (one settings.json read for both steps)
     console.print()
-    if is_hook_installed():
+    settings = _load_settings()
+    if is_hook_installed(settings):
         console.print("[dim]Auto-sync hook already installed[/dim]")
     elif click.confirm("Install Claude hook for automatic hourly sync?", default=True):
-        if install_hook():
+        if install_hook(settings):
             console.print("[green]Hook installed![/green]")
             console.print("[dim]Forge will sync automatically on each Claude prompt (max once per hour)[/dim]")
         else:
@@ -209,8 +231,9 @@ def sync(force: bool, retry: bool, status: bool):
             console.print(f"  ... and {len(pending) - 5} more")
         return
 
+    cfg = load_config()
+
     if retry:
-        cfg = load_config()
         if not cfg.get("server_url") or not cfg.get("api_key"):
             console.print("[red]Server not configured[/red]")
             return
@@ -220,7 +243,7 @@ def sync(force: bool, retry: bool, status: bool):
             console.print(f"[yellow]{fail} still pending[/yellow]")
         return
 
-    result = maybe_auto_sync(force=force) if not force else do_sync(load_config())
+    result = do_sync(cfg) if force else maybe_auto_sync(config=cfg)
     show_sync_status(result, get_pending_count())
 
 
@@ -231,8 +254,6 @@ def sync(force: bool, retry: bool, status: bool):
 @click.option('--local', is_flag=True, help='Show local data only (no server)')
 def stats(days: int, local: bool):
     """Show usage statistics: model breakdown, costs, daily graph, and goal progress."""
-    config = load_config()
-
     if local:
         # Local mode - read from session files directly
         model_usage = get_model_usage_from_sessions()
@@ -253,8 +274,10 @@ def stats(days: int, local: bool):
         render_recent_table(daily_data)
         return
 
-    # Server mode: sync if needed, then fetch from server
-    result = maybe_auto_sync()
+    # Server mode: sync if needed, then fetch from server (config is only
+    # needed on this branch, so --local never touches it)
+    config = load_config()
+    result = maybe_auto_sync(config=config)
     show_sync_status(result, get_pending_count())
 
     if not config.get("last_sync_success", True):
@@ -1,8 +1,27 @@
 """Configuration management for forge client."""
-import json
+import os
 from pathlib import Path
 from typing import Optional
 
+try:
+    # Same fast-parser setup as claude_code: orjson reads bytes directly
+    # and serializes several times faster than stdlib json.
+    from orjson import (
+        OPT_INDENT_2 as _OPT_INDENT_2,
+        JSONDecodeError as _JSONDecodeError,
+        dumps as _orjson_dumps,
+        loads as _json_loads,
+    )
+
+    def _json_dumps(obj: dict) -> bytes:
+        return _orjson_dumps(obj, option=_OPT_INDENT_2)
+except ImportError:
+    from json import JSONDecodeError as _JSONDecodeError, loads as _json_loads
+    from json import dumps as _stdlib_dumps
+
+    def _json_dumps(obj: dict) -> bytes:
+        return _stdlib_dumps(obj, indent=2).encode()
+
 CONFIG_DIR = Path.home() / ".claudeforge"
 CONFIG_PATH = CONFIG_DIR / "config.json"
 
@@ -16,22 +35,48 @@ DEFAULT_CONFIG = {
 }
 
 
+_config_cache: Optional[tuple] = None  # (mtime_ns, merged dict)
+
+
 def load_config() -> dict:
-    """Load config from file, with defaults."""
+    """Load config from file, with defaults.
+
+    The parse is cached and revalidated by mtime, so repeated loads within
+    one invocation are dict copies instead of read + json.loads; callers
+    get their own copy so local mutation can't leak into later loads.
+    """
+    global _config_cache
+    try:
+        mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return DEFAULT_CONFIG.copy()
+    if _config_cache is not None and _config_cache[0] == mtime_ns:
+        return _config_cache[1].copy()
     config = DEFAULT_CONFIG.copy()
-    if CONFIG_PATH.exists():
-        try:
-            stored = json.loads(CONFIG_PATH.read_text())
-            config.update(stored)
-        except (json.JSONDecodeError, IOError):
-            pass
-    return config
+    try:
+        config.update(_json_loads(CONFIG_PATH.read_bytes()))
+    except (_JSONDecodeError, IOError):
+        pass
+    _config_cache = (mtime_ns, config)
+    return config.copy()
 
 
 def save_config(config: dict) -> None:
     """Save config to file."""
+    global _config_cache
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_PATH.write_text(json.dumps(config, indent=2))
+    # Write-then-rename so a concurrent forge invocation (e.g. the sync
+    # hook racing a manual command) never sees a partially written file
+    tmp = CONFIG_PATH.with_suffix(".json.tmp")
+    tmp.write_bytes(_json_dumps(config))
+    os.replace(tmp, CONFIG_PATH)
+    # Seed the cache with what was just written so the next load skips the
+    # re-read entirely
+    try:
+        _config_cache = (CONFIG_PATH.stat().st_mtime_ns,
+                         {**DEFAULT_CONFIG, **config})
+    except OSError:
+        _config_cache = None
 
 
 def get_config_value(key: str) -> Optional[str]:
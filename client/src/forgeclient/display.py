@@ -1,9 +1,67 @@
 """Terminal display using Rich."""
-from datetime import datetime, timedelta, timezone
-from rich.console import Console
-from rich.table import Table
-
-console = Console()
+import math
+import re
+from operator import itemgetter
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+
+class _LazyConsole:
+    """Stand-in that creates the real rich Console on first use.
+
+    Importing rich costs tens of milliseconds; commands that never print
+    (or print nothing before failing fast) shouldn't pay it. The first
+    attribute access builds the Console and caches the bound attribute,
+    so subsequent prints go straight through.
+    """
+
+    _real = None
+
+    def __getattr__(self, name):
+        real = _LazyConsole._real
+        if real is None:
+            from rich.console import Console
+            real = _LazyConsole._real = Console()
+        value = getattr(real, name)
+        object.__setattr__(self, name, value)
+        return value
+
+
+console = _LazyConsole()
+
+# Matches runs of bar characters so a whole run gets one [green] span
+# instead of per-cell open/close tags
+_BAR_RUN = re.compile(r"[^ ]+")
+
+_DOW = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# Threshold bands resolved with bisect instead of if/elif ladders; index i
+# covers values in (bands[i-1], bands[i]], the last slot everything above.
+_PCT_BANDS = (50, 80, 150)
+_PCT_FMTS = ("[dim]{:.0f}%[/dim]", "[yellow]{:.0f}%[/yellow]",
+             "[green]{:.0f}%[/green]", "[bold green]{:.0f}%[/bold green]")
+# upper bound is exclusive (a day must exceed +20% to count as up), so
+# bump it by one ulp for bisect_right
+_TREND_BANDS = (-20, math.nextafter(20, math.inf))
+_TREND_MARKS = ("[red]↓[/red]", "[dim]→[/dim]", "[green]↑[/green]")
+_NORM_BANDS = (50, 80, 100)
+_NORM_FMTS = (("[red]{:.0f}%[/red]", "[red]way behind[/red]"),
+              ("[yellow]{:.0f}%[/yellow]", "[yellow]behind[/yellow]"),
+              ("[green]{:.0f}%[/green]", "[green]on track[/green]"),
+              ("[bold green]{:.0f}%[/bold green]", "[green]ahead[/green]"))
+
+
+@lru_cache(maxsize=512)
+def _dow(date_str: str) -> str:
+    """Day-of-week abbreviation for a YYYY-MM-DD string.
+
+    date.fromisoformat is C-accelerated (much faster than strptime) and the
+    cache amortizes repeat dates across renders.
+    """
+    try:
+        return _DOW[date.fromisoformat(date_str).weekday()]
+    except ValueError:
+        return "?"
 
 
 def _to_local_date(date_str: str) -> str:
@@ -26,43 +84,59 @@ def _to_local_date(date_str: str) -> str:
 BAR_CHARS = " ▁▂▃▄▅▆▇█"
 GRAPH_HEIGHT = 12
 
+# Pre-baked horizontal rules (invariant per render)
+_HR50 = "  [dim]" + "─" * 50 + "[/dim]"
+_HR60 = "  [dim]" + "─" * 60 + "[/dim]"
+
 # Goal: 100 billion tokens by end of 2026
 YEARLY_GOAL = 100_000_000_000
 GOAL_YEAR = 2026
+_YEAR_STR = str(GOAL_YEAR)
+_YEAR_START_ORD = date(GOAL_YEAR, 1, 1).toordinal()
+_YEAR_END_ORD = date(GOAL_YEAR, 12, 31).toordinal()
 
 
+_SUFFIXES = ((1_000_000_000, 1e9, "B", 2),
+             (1_000_000, 1e6, "M", 1),
+             (1_000, 1e3, "K", 1))
+
+
+@lru_cache(maxsize=256)
 def format_number(n: int) -> str:
-    """Format number with K/M suffix."""
-    if n >= 1_000_000_000:
-        return f"{n / 1_000_000_000:.2f}B"
-    if n >= 1_000_000:
-        return f"{n / 1_000_000:.1f}M"
-    if n >= 1_000:
-        return f"{n / 1_000:.1f}K"
+    """Format number with K/M suffix.
+
+    Cached: a stats view formats the same totals (and lots of zeros)
+    dozens of times per render.
+    """
+    if n < 1000:
+        return str(n)
+    for threshold, divisor, suffix, places in _SUFFIXES:
+        if n >= threshold:
+            return f"{n / divisor:.{places}f}{suffix}"
     return str(n)
 
 
-def _calculate_goal_progress(data: list[dict]) -> dict:
+def _calculate_goal_progress(data: list[dict], today: date | None = None) -> dict:
     """Calculate progress toward yearly token goal."""
-    now = datetime.now()
-    year_start = datetime(GOAL_YEAR, 1, 1)
-    year_end = datetime(GOAL_YEAR, 12, 31, 23, 59, 59)
-
-    # Filter to current year only
-    year_str = str(GOAL_YEAR)
-    year_data = [d for d in data if d.get("date", "").startswith(year_str)]
-    year_total = sum(d.get("total_tokens", 0) for d in year_data)
-
-    # Days elapsed and remaining
-    if now.year < GOAL_YEAR:
+    # Filter to current year only (slice compare beats startswith for a
+    # 4-char constant, and no intermediate list)
+    year_total = sum(d.get("total_tokens", 0) for d in data
+                     if d.get("date", "")[:4] == _YEAR_STR)
+
+    # Days elapsed and remaining, via integer ordinal math — no datetime
+    # or timedelta objects needed
+    if today is None:
+        today = date.today()
+    if today.year < GOAL_YEAR:
         days_elapsed = 0
         days_remaining = 365
-    elif now.year > GOAL_YEAR:
+    elif today.year > GOAL_YEAR:
         days_elapsed = 365
         days_remaining = 0
     else:
-        days_elapsed = (now - year_start).days + 1
-        days_remaining = (year_end - now).days
+        today_ord = today.toordinal()
+        days_elapsed = today_ord - _YEAR_START_ORD + 1
+        days_remaining = _YEAR_END_ORD - today_ord
 
     # Expected progress (linear)
     year_progress_pct = days_elapsed / 365
@@ -100,28 +174,37 @@ def _calculate_goal_progress(data: list[dict]) -> dict:
     }
 
 
-def _calculate_streak(data: list[dict]) -> int:
-    """Calculate consecutive days of usage ending today or yesterday."""
-    if not data:
+def _calculate_streak(active_dates: set[str], today: date | None = None) -> int:
+    """Calculate consecutive days of usage ending today or yesterday.
+
+    Takes the set of YYYY-MM-DD strings with nonzero usage, which the
+    caller collects while aggregating so the window isn't rescanned.
+    """
+    if not active_dates:
         return 0
 
-    today = datetime.now().strftime('%Y-%m-%d')
-    yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-    dates_with_usage = {d["date"] for d in data if d.get("total_tokens", 0) > 0}
+    try:
+        active = sorted((date.fromisoformat(d) for d in active_dates),
+                        reverse=True)
+    except ValueError:
+        return 0
 
     # Start counting from today or yesterday
-    if today in dates_with_usage:
-        start = datetime.now()
-    elif yesterday in dates_with_usage:
-        start = datetime.now() - timedelta(days=1)
-    else:
+    if today is None:
+        today = date.today()
+    if active[0] != today and active[0] != today - timedelta(days=1):
         return 0
 
+    # One reverse scan over the sorted dates; date comparison is a C-level
+    # compare, no per-day string formatting
+    one_day = timedelta(days=1)
+    expected = active[0]
     streak = 0
-    current = start
-    while current.strftime('%Y-%m-%d') in dates_with_usage:
+    for d in active:
+        if d != expected:
+            break
         streak += 1
-        current -= timedelta(days=1)
+        expected -= one_day
 
     return streak
 
@@ -132,16 +215,31 @@ def render_recent_table(data: list[dict], days: int = 7):
         console.print("[yellow]No usage data available[/yellow]")
         return
 
-    # Calculate 30-day average
-    avg_30d = sum(d.get("total_tokens", 0) for d in data) / len(data) if data else 0
+    # One pass over the window: the 30-day sum and the set of active
+    # dates the streak helper needs
+    total_sum = 0
+    active_dates = set()
+    for d in data:
+        t = d.get("total_tokens", 0)
+        total_sum += t
+        if t > 0:
+            active_dates.add(d["date"])
+    avg_30d = total_sum / len(data)
 
     # Get last N days
     recent = data[-days:] if len(data) >= days else data
 
+    # One shared clock read for the streak and goal helpers (also keeps
+    # them consistent if the render straddles midnight)
+    today = date.today()
+
     # Calculate streak
-    streak = _calculate_streak(data)
+    streak = _calculate_streak(active_dates, today)
+
+    # Build table (rich imports deferred to first render)
+    from rich.console import Group
+    from rich.table import Table
 
-    # Build table
     table = Table(title="Recent Usage", show_header=True, header_style="bold cyan")
     table.add_column("Date", style="dim")
     table.add_column("Day", style="dim")
@@ -149,20 +247,20 @@ def render_recent_table(data: list[dict], days: int = 7):
     table.add_column("vs Avg", justify="right")
     table.add_column("Trend", justify="center")
 
-    prev_total = None
-    totals = [d.get("total_tokens", 0) for d in recent]
+    # Totals and their sum in one pass; the row loop below reuses both
+    totals = []
+    total_recent = 0
+    for d in recent:
+        t = d.get("total_tokens", 0)
+        totals.append(t)
+        total_recent += t
 
-    for day in recent:
-        date_str = day["date"]
-        local_date = _to_local_date(date_str)
-        total = day.get("total_tokens", 0)
+    prev_total = None
+    for day, total in zip(recent, totals):
+        local_date = _to_local_date(day["date"])
 
         # Day of week (use local date)
-        try:
-            dt = datetime.strptime(local_date, '%Y-%m-%d')
-            dow = dt.strftime('%a')
-        except ValueError:
-            dow = "?"
+        dow = _dow(local_date)
 
         # Format tokens
         tokens_str = format_number(total)
@@ -170,82 +268,69 @@ def render_recent_table(data: list[dict], days: int = 7):
         # Percentage of average
         if avg_30d > 0:
             pct = (total / avg_30d) * 100
-            if pct >= 150:
-                pct_str = f"[bold green]{pct:.0f}%[/bold green]"
-            elif pct >= 80:
-                pct_str = f"[green]{pct:.0f}%[/green]"
-            elif pct >= 50:
-                pct_str = f"[yellow]{pct:.0f}%[/yellow]"
-            else:
-                pct_str = f"[dim]{pct:.0f}%[/dim]"
+            pct_str = _PCT_FMTS[bisect_right(_PCT_BANDS, pct)].format(pct)
         else:
             pct_str = "-"
 
         # Trend vs previous day
         if prev_total is not None and prev_total > 0:
             change = ((total - prev_total) / prev_total) * 100
-            if change > 20:
-                trend = "[green]↑[/green]"
-            elif change < -20:
-                trend = "[red]↓[/red]"
-            else:
-                trend = "[dim]→[/dim]"
+            trend = _TREND_MARKS[bisect_right(_TREND_BANDS, change)]
         else:
             trend = ""
 
         table.add_row(local_date[5:], dow, tokens_str, pct_str, trend)
         prev_total = total
 
-    console.print()
-    console.print(table)
+    # Collect everything into one Group so the console renders (and
+    # flushes) once instead of once per fragment
+    parts = ["", table, ""]
 
     # Summary line
-    total_recent = sum(totals)
-    console.print()
-    console.print(f"  [bold]Week total:[/bold] {format_number(total_recent)}  │  [bold]30d avg:[/bold] {format_number(int(avg_30d))}/day  │  [bold]Streak:[/bold] {streak} day{'s' if streak != 1 else ''} {'🔥' if streak >= 7 else ''}")
+    parts.append(f"  [bold]Week total:[/bold] {format_number(total_recent)}  │  [bold]30d avg:[/bold] {format_number(int(avg_30d))}/day  │  [bold]Streak:[/bold] {streak} day{'s' if streak != 1 else ''} {'🔥' if streak >= 7 else ''}")
 
     # Goal progress
-    goal = _calculate_goal_progress(data)
-    console.print()
-    console.print(f"  [bold cyan]2026 Goal: 100B tokens[/bold cyan]")
-    console.print(f"  [dim]{'─' * 50}[/dim]")
+    goal = _calculate_goal_progress(data, today)
+    parts.append("")
+    parts.append(f"  [bold cyan]2026 Goal: 100B tokens[/bold cyan]")
+    parts.append(_HR50)
 
     # Progress bar
     bar_width = 40
     filled = int((goal['absolute_pct'] / 100) * bar_width)
     expected_marker = int((goal['days_elapsed'] / 365) * bar_width)
-    bar = ""
-    for i in range(bar_width):
-        if i < filled:
-            bar += "[green]█[/green]"
-        elif i == expected_marker:
-            bar += "[yellow]│[/yellow]"
+    # One span per run instead of one per character: green fill, then dim
+    # remainder split around the yellow expected-progress marker
+    segments = []
+    fill = min(filled, bar_width)
+    if fill > 0:
+        segments.append(f"[green]{'█' * fill}[/green]")
+    if fill < bar_width:
+        if fill <= expected_marker < bar_width:
+            if expected_marker > fill:
+                segments.append(f"[dim]{'░' * (expected_marker - fill)}[/dim]")
+            segments.append("[yellow]│[/yellow]")
+            if expected_marker + 1 < bar_width:
+                segments.append(f"[dim]{'░' * (bar_width - expected_marker - 1)}[/dim]")
         else:
-            bar += "[dim]░[/dim]"
+            segments.append(f"[dim]{'░' * (bar_width - fill)}[/dim]")
+    bar = "".join(segments)
 
-    console.print(f"  {bar} {goal['absolute_pct']:.2f}%")
+    parts.append(f"  {bar} {goal['absolute_pct']:.2f}%")
 
     # Color the normalized progress
     norm_pct = goal['normalized_pct']
-    if norm_pct >= 100:
-        norm_str = f"[bold green]{norm_pct:.0f}%[/bold green]"
-        status = "[green]ahead[/green]"
-    elif norm_pct >= 80:
-        norm_str = f"[green]{norm_pct:.0f}%[/green]"
-        status = "[green]on track[/green]"
-    elif norm_pct >= 50:
-        norm_str = f"[yellow]{norm_pct:.0f}%[/yellow]"
-        status = "[yellow]behind[/yellow]"
-    else:
-        norm_str = f"[red]{norm_pct:.0f}%[/red]"
-        status = "[red]way behind[/red]"
+    norm_fmt, status = _NORM_FMTS[bisect_right(_NORM_BANDS, norm_pct)]
+    norm_str = norm_fmt.format(norm_pct)
+
+    parts.append(f"  [bold]Year total:[/bold] {format_number(goal['year_total'])} of 100B ({goal['absolute_pct']:.2f}%)")
+    parts.append(f"  [bold]Expected:[/bold]  {format_number(goal['expected_tokens'])} by today (day {goal['days_elapsed']}/365)")
+    parts.append(f"  [bold]Status:[/bold]    {norm_str} of expected - {status}")
+    parts.append(f"  [bold]Required:[/bold]  {format_number(int(goal['required_daily']))}/day for remaining {goal['days_remaining']} days")
+    parts.append(f"  [bold]Current:[/bold]   {format_number(int(goal['actual_daily_avg']))}/day average")
+    parts.append("")
 
-    console.print(f"  [bold]Year total:[/bold] {format_number(goal['year_total'])} of 100B ({goal['absolute_pct']:.2f}%)")
-    console.print(f"  [bold]Expected:[/bold]  {format_number(goal['expected_tokens'])} by today (day {goal['days_elapsed']}/365)")
-    console.print(f"  [bold]Status:[/bold]    {norm_str} of expected - {status}")
-    console.print(f"  [bold]Required:[/bold]  {format_number(int(goal['required_daily']))}/day for remaining {goal['days_remaining']} days")
-    console.print(f"  [bold]Current:[/bold]   {format_number(int(goal['actual_daily_avg']))}/day average")
-    console.print()
+    console.print(Group(*parts))
 
 
 def render_daily_graph(data: list[dict], title: str):
@@ -254,18 +339,41 @@ def render_daily_graph(data: list[dict], title: str):
         console.print("[yellow]No usage data available[/yellow]")
         return
 
-    totals = [d.get("total_tokens", 0) for d in data]
-    max_val = max(totals) if totals else 1
+    # Single pass for totals, max, argmax, and message count instead of
+    # separate max/index/sum sweeps over the same rows
+    totals = []
+    total_tokens = 0
+    total_messages = 0
+    max_val = 0
+    peak_idx = 0
+    for i, d in enumerate(data):
+        dget = d.get
+        t = dget("total_tokens", 0)
+        totals.append(t)
+        total_tokens += t
+        total_messages += dget("message_count", 0)
+        if t > max_val:
+            max_val = t
+            peak_idx = i
 
     lines = []
     lines.append("")
     lines.append(f"  [bold cyan]{title}[/bold cyan]")
-    lines.append(f"  [dim]{'─' * 50}[/dim]")
+    lines.append(_HR50)
+
+    # Precompute each bar's shape once — how many rows it fills and the
+    # partial-height character for the row above — so the cell loop below
+    # is an integer compare plus a lookup instead of float arithmetic, and
+    # rows are joined instead of grown by repeated concatenation.
+    if max_val:
+        step = max_val / GRAPH_HEIGHT
+        bars = [(int(t / step), BAR_CHARS[int((t % step) / step * 8)])
+                for t in totals]
+    else:
+        bars = [(GRAPH_HEIGHT, " ")] * len(totals)
 
     # Build vertical bar chart
     for row in range(GRAPH_HEIGHT, 0, -1):
-        threshold = (row / GRAPH_HEIGHT) * max_val
-
         # Y-axis label
         if row == GRAPH_HEIGHT:
             label = format_number(int(max_val)).rjust(6)
@@ -276,18 +384,18 @@ def render_daily_graph(data: list[dict], title: str):
         else:
             label = " " * 6
 
-        line = f"[dim]{label}[/dim] │"
-
-        for total in totals:
-            if total >= threshold:
-                line += "[green]█[/green]"
-            elif total >= threshold - (max_val / GRAPH_HEIGHT):
-                idx = int((total % (max_val / GRAPH_HEIGHT)) / (max_val / GRAPH_HEIGHT) * 8)
-                line += f"[green]{BAR_CHARS[idx]}[/green]"
+        cells = []
+        for full, partial in bars:
+            if full >= row:
+                cells.append("█")
+            elif full == row - 1:
+                cells.append(partial)
             else:
-                line += " "
+                cells.append(" ")
 
-        lines.append(line)
+        row_chars = _BAR_RUN.sub(lambda m: f"[green]{m.group()}[/green]",
+                                 "".join(cells))
+        lines.append(f"[dim]{label}[/dim] │{row_chars}")
 
     # X-axis with tick marks
     num_days = len(totals)
@@ -310,17 +418,13 @@ def render_daily_graph(data: list[dict], title: str):
             lines.append(f"[dim]        {first} → {last}[/dim]")
 
         # Show the peak day
-        max_tokens = max(totals)
-        peak_idx = totals.index(max_tokens)
         peak_date = _to_local_date(data[peak_idx]["date"])
-        lines.append(f"[dim]        Peak: {peak_date} ({format_number(max_tokens)} tokens)[/dim]")
+        lines.append(f"[dim]        Peak: {peak_date} ({format_number(max_val)} tokens)[/dim]")
 
     lines.append("")
 
     # Summary stats
-    total_tokens = sum(totals)
-    total_messages = sum(d.get("message_count", 0) for d in data)
-    lines.append(f"  [dim]{'─' * 50}[/dim]")
+    lines.append(_HR50)
     lines.append(f"  [bold]Total:[/bold] {format_number(total_tokens)} tokens, {total_messages:,} messages")
     if len(data) > 0:
         lines.append(f"  [bold]Average:[/bold] {format_number(total_tokens // len(data))}/day")
@@ -350,8 +454,10 @@ def show_stale_warning(config: dict):
     """Warn if data might be stale."""
     if not config.get("last_sync_success", True):
         last_error = config.get("last_error", "unknown error")
-        console.print(f"[yellow]⚠ Last sync failed: {last_error}[/yellow]")
-        console.print("[dim]  Showing cached data. Run 'forge sync' to retry.[/dim]")
+        console.print(
+            f"[yellow]⚠ Last sync failed: {last_error}[/yellow]\n"
+            "[dim]  Showing cached data. Run 'forge sync' to retry.[/dim]"
+        )
 
 
 def _estimate_cost(model: str, input_tok: int, output_tok: int, cache_read: int, cache_create: int) -> float:
@@ -395,7 +501,7 @@ def render_model_usage(model_usage: list[dict], summary: dict = None, weekly_dat
     lines = []
     lines.append("")
     lines.append("  [bold cyan]Token Usage by Model[/bold cyan]")
-    lines.append(f"  [dim]{'─' * 60}[/dim]")
+    lines.append(_HR60)
 
     grand_total = 0
     grand_input = 0
@@ -404,12 +510,18 @@ def render_model_usage(model_usage: list[dict], summary: dict = None, weekly_dat
     grand_cache_create = 0
     grand_cost = 0.0
 
-    for usage in sorted(model_usage, key=lambda x: x.get("total_tokens", 0), reverse=True):
-        model = usage.get("model", "unknown")
-        input_tok = usage.get("input_tokens", 0)
-        output_tok = usage.get("output_tokens", 0)
-        cache_read = usage.get("cache_read_tokens", 0)
-        cache_create = usage.get("cache_creation_tokens", 0)
+    # Key once, sort on the precomputed subtotal (no lambda re-invoking
+    # dict lookups per comparison), and bind each row's .get once
+    keyed = [(u.get("total_tokens", 0), u) for u in model_usage]
+    keyed.sort(key=itemgetter(0), reverse=True)
+
+    for _total, usage in keyed:
+        uget = usage.get
+        model = uget("model", "unknown")
+        input_tok = uget("input_tokens", 0)
+        output_tok = uget("output_tokens", 0)
+        cache_read = uget("cache_read_tokens", 0)
+        cache_create = uget("cache_creation_tokens", 0)
 
         # Calculate cost
         cost = _estimate_cost(model, input_tok, output_tok, cache_read, cache_create)
@@ -432,7 +544,7 @@ def render_model_usage(model_usage: list[dict], summary: dict = None, weekly_dat
         grand_cost += cost
 
     lines.append("")
-    lines.append(f"  [dim]{'─' * 60}[/dim]")
+    lines.append(_HR60)
     lines.append(f"  [bold]Totals (all models)[/bold]")
     lines.append(f"    Input:          {format_number(grand_input):>10}")
     lines.append(f"    Output:         {format_number(grand_output):>10}")
@@ -455,7 +567,7 @@ def render_model_usage(model_usage: list[dict], summary: dict = None, weekly_dat
 
     if summary:
         lines.append("")
-        lines.append(f"  [dim]{'─' * 60}[/dim]")
+        lines.append(_HR60)
         parts = []
         if summary.get("total_messages"):
             parts.append(f"{summary['total_messages']:,} messages")
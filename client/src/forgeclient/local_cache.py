@@ -1,100 +1,306 @@
 """Local cache for offline operation and pending syncs."""
-import json
+import asyncio
+import hashlib
+import mmap
+import os
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional
-import httpx
+
+try:
+    # Same orjson-with-fallback arrangement as config/claude_code; the
+    # pending queue is rewritten on every enqueue, so serialization speed
+    # matters here.
+    from orjson import (
+        JSONDecodeError as _JSONDecodeError,
+        dumps as _json_dumps,
+        loads as _json_loads,
+    )
+except ImportError:
+    from json import JSONDecodeError as _JSONDecodeError
+    from json import dumps as _stdlib_dumps, loads as _stdlib_loads
+
+    def _json_dumps(obj: list | dict) -> bytes:
+        return _stdlib_dumps(obj, separators=(",", ":")).encode()
+
+    def _json_loads(buf):
+        # stdlib json can't parse a bare buffer (mmap), so copy it first;
+        # orjson takes anything supporting the buffer protocol directly
+        if not isinstance(buf, (str, bytes, bytearray)):
+            buf = bytes(buf)
+        return _stdlib_loads(buf)
 
 CACHE_DIR = Path.home() / ".claudeforge" / "cache"
-PENDING_SYNCS = CACHE_DIR / "pending_syncs.json"
+PENDING_SYNCS = CACHE_DIR / "pending_syncs.jsonl"
 LAST_SERVER_DATA = CACHE_DIR / "last_server_data.json"
 USAGE_SNAPSHOTS = CACHE_DIR / "usage_snapshots.json"
+DAILY_DELTAS = CACHE_DIR / "daily_deltas.json"
 MAX_PENDING_SYNCS = 100
+MAX_CONCURRENT_RETRIES = 8
+# Files at or above this are mmapped for parsing instead of read into an
+# intermediate bytes object; below it the plain read is cheaper.
+_MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+
+# Parsed-file memo keyed by (mtime_ns, size); one CLI run can load the
+# snapshot and server-data files several times.
+_MEMO: dict[Path, tuple[int, int, list | dict]] = {}
 
 
 def _load_json(path: Path) -> Optional[list | dict]:
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return None
+    hit = _MEMO.get(path)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
     try:
-        return json.loads(path.read_text())
-    except (json.JSONDecodeError, IOError):
+        if st.st_size >= _MMAP_THRESHOLD:
+            # Zero-copy parse for big caches (last_server_data.json can
+            # hold a multi-week daily dump): the parser reads straight
+            # from the page cache through the mapping
+            with open(path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                data = _json_loads(view)
+        else:
+            data = _json_loads(path.read_bytes())
+    except (_JSONDecodeError, IOError, ValueError):
         return None
+    _MEMO[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
 
 
 def _save_json(path: Path, data: list | dict) -> None:
+    # Compact bytes straight from the serializer; the temp-file +
+    # os.replace dance makes the write atomic, so a crash mid-save can't
+    # torch the pending-sync queue.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2))
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(_json_dumps(data))
+    os.replace(tmp, path)
+    _MEMO.pop(path, None)
+
+
+_pending_cache: Optional[tuple] = None  # (mtime_ns, parsed list)
+
+
+def _rewrite_pending(items: list[dict]) -> None:
+    """Atomically replace the pending queue with the given entries."""
+    global _pending_cache
+    PENDING_SYNCS.parent.mkdir(parents=True, exist_ok=True)
+    tmp = PENDING_SYNCS.with_suffix(".jsonl.tmp")
+    tmp.write_bytes(b"".join(_json_dumps(item) + b"\n" for item in items))
+    os.replace(tmp, PENDING_SYNCS)
+    # Seed the cache with what was just written (like save_server_data):
+    # file mtimes use the coarse kernel clock, so a write landing in the
+    # same tick as the last read would otherwise leave the stale list
+    # looking valid — and the append-time dedup would then drop payloads.
+    try:
+        _pending_cache = (PENDING_SYNCS.stat().st_mtime_ns, list(items))
+    except OSError:
+        _pending_cache = None
 
 
-def queue_sync(payload: dict) -> bool:
-    """Queue a sync for later retry."""
-    pending = _load_json(PENDING_SYNCS) or []
+def queue_sync(payload: dict, body: Optional[bytes] = None) -> bool:
+    """Queue a sync for later retry.
 
-    if len(pending) >= MAX_PENDING_SYNCS:
-        pending = pending[1:]  # Remove oldest
+    The queue is a JSONL file appended one line per entry, so enqueueing
+    is O(1) I/O instead of a full read-modify-rewrite of every queued
+    payload. The size cap triggers a rewrite only on overflow.
 
-    pending.append({
-        "payload": payload,
-        "queued_at": datetime.now().isoformat()
-    })
-    _save_json(PENDING_SYNCS, pending)
+    Each entry carries a fingerprint of its payload; when the newest
+    queued entry already has the same fingerprint the enqueue is a no-op,
+    so a client retrying against a down server doesn't stack identical
+    payloads it would later POST redundantly.
+
+    Callers that already serialized the payload (do_sync posts the same
+    bytes) pass them as `body`; the bytes are spliced into the queue
+    line directly, so the payload is never encoded twice.
+    """
+    global _pending_cache
+    if body is None:
+        body = _json_dumps(payload)
+    fp = hashlib.blake2b(body, digest_size=16).hexdigest()
+    pending = list_pending()
+    if pending and pending[-1].get("fp") == fp:
+        return True
+
+    # Build the entry line around the payload bytes instead of dumping a
+    # wrapper dict that would re-serialize them
+    queued_at = datetime.now().isoformat()
+    meta = _json_dumps({"queued_at": queued_at, "fp": fp})
+    line = b'{"payload":' + body + b"," + meta[1:] + b"\n"
+    PENDING_SYNCS.parent.mkdir(parents=True, exist_ok=True)
+    with open(PENDING_SYNCS, "ab") as f:
+        f.write(line)
+    # Seed the cache past the append; coarse mtimes can't be trusted to
+    # change between writes within one clock tick (see _rewrite_pending)
+    try:
+        _pending_cache = (
+            PENDING_SYNCS.stat().st_mtime_ns,
+            pending + [{"payload": payload, "queued_at": queued_at, "fp": fp}],
+        )
+    except OSError:
+        _pending_cache = None
+
+    if get_pending_count() > MAX_PENDING_SYNCS:
+        _rewrite_pending(list_pending()[-MAX_PENDING_SYNCS:])
     return True
 
 
 def get_pending_count() -> int:
-    """Return count of pending syncs."""
-    pending = _load_json(PENDING_SYNCS) or []
-    return len(pending)
+    """Return count of pending syncs (newline count, no parsing)."""
+    try:
+        return PENDING_SYNCS.read_bytes().count(b"\n")
+    except OSError:
+        return 0
 
 
 def list_pending() -> list[dict]:
-    """Return pending syncs with metadata."""
-    return _load_json(PENDING_SYNCS) or []
+    """Return pending syncs with metadata.
+
+    Cached per mtime; queue appends and rewrites bump the file's mtime,
+    so repeat listings within one run parse nothing.
+    """
+    global _pending_cache
+    try:
+        mtime_ns = PENDING_SYNCS.stat().st_mtime_ns
+        lines = None
+        if _pending_cache is not None and _pending_cache[0] == mtime_ns:
+            return _pending_cache[1]
+        lines = PENDING_SYNCS.read_bytes().splitlines()
+    except OSError:
+        return []
+
+    pending = []
+    for line in lines:
+        if not line:
+            continue
+        try:
+            pending.append(_json_loads(line))
+        except _JSONDecodeError:
+            continue  # torn tail line from a crash mid-append
+    _pending_cache = (mtime_ns, pending)
+    return pending
 
 
 def clear_pending() -> None:
     """Clear all pending syncs."""
-    _save_json(PENDING_SYNCS, [])
+    _rewrite_pending([])
+
+
+async def _post_pending(client: "httpx.AsyncClient", sem: asyncio.Semaphore,
+                        server_url: str, api_key: str, item: dict) -> None:
+    async with sem:
+        response = await client.post(
+            f"{server_url}/v1/sync",
+            content=_json_dumps(item["payload"]),
+            headers={"X-API-Key": api_key,
+                     "Content-Type": "application/json"}
+        )
+        response.raise_for_status()
+
+
+async def _process_pending_async(pending: list[dict], server_url: str,
+                                 api_key: str, timeout: float) -> list:
+    import httpx
+
+    sem = asyncio.Semaphore(MAX_CONCURRENT_RETRIES)
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        return await asyncio.gather(
+            *(_post_pending(client, sem, server_url, api_key, item)
+              for item in pending),
+            return_exceptions=True
+        )
 
 
 def process_pending_syncs(server_url: str, api_key: str, timeout: float = 30.0) -> tuple[int, int]:
-    """Try to sync pending items. Returns (success_count, fail_count)."""
-    pending = _load_json(PENDING_SYNCS) or []
+    """Try to sync pending items. Returns (success_count, fail_count).
+
+    Items post concurrently (bounded by MAX_CONCURRENT_RETRIES) over one
+    connection pool, so a backlog drains in a few round trips instead of
+    paying one RTT per queued payload.
+    """
+    pending = list_pending()
     if not pending:
         return 0, 0
 
-    success = 0
-    remaining = []
+    results = asyncio.run(
+        _process_pending_async(pending, server_url, api_key, timeout))
+    remaining = [item for item, result in zip(pending, results)
+                 if isinstance(result, Exception)]
+
+    _rewrite_pending(remaining)
+    return len(pending) - len(remaining), len(remaining)
 
-    with httpx.Client(timeout=timeout) as client:
-        for item in pending:
-            try:
-                response = client.post(
-                    f"{server_url}/v1/sync",
-                    json=item["payload"],
-                    headers={"X-API-Key": api_key}
-                )
-                response.raise_for_status()
-                success += 1
-            except Exception:
-                remaining.append(item)
 
-    _save_json(PENDING_SYNCS, remaining)
-    return success, len(remaining)
+_server_data_cache: Optional[tuple] = None  # (mtime_ns, parsed dict)
 
 
 def save_server_data(data: dict) -> None:
     """Cache server response for offline display."""
+    global _server_data_cache
     _save_json(LAST_SERVER_DATA, {
         "data": data,
         "cached_at": datetime.now().isoformat()
     })
+    # Seed the in-process cache with what was just written
+    try:
+        _server_data_cache = (LAST_SERVER_DATA.stat().st_mtime_ns, data)
+    except OSError:
+        _server_data_cache = None
 
 
 def load_server_data() -> Optional[dict]:
-    """Load cached server data."""
+    """Load cached server data.
+
+    Revalidated by mtime like the config cache, so repeat loads within
+    one CLI run skip the disk read and parse.
+    """
+    global _server_data_cache
+    try:
+        mtime_ns = LAST_SERVER_DATA.stat().st_mtime_ns
+    except OSError:
+        return None
+    if _server_data_cache is not None and _server_data_cache[0] == mtime_ns:
+        return _server_data_cache[1]
     cached = _load_json(LAST_SERVER_DATA)
-    return cached.get("data") if cached else None
+    data = cached.get("data") if cached else None
+    _server_data_cache = (mtime_ns, data)
+    return data
+
+
+def _day_delta(prev_usage: dict[str, dict], curr_usage: dict[str, dict],
+               curr_date: str) -> dict:
+    """Token deltas between two snapshots' model maps, summed over models."""
+    day_input = 0
+    day_output = 0
+    day_cache_read = 0
+    day_cache_create = 0
+
+    # Models present only in the previous snapshot can't contribute:
+    # every field would clamp at max(0, 0 - prev) == 0. So only the
+    # current snapshot's models need visiting — no union set at all.
+    _empty: dict = {}
+    for model, curr in curr_usage.items():
+        pget = prev_usage.get(model, _empty).get
+        cget = curr.get
+
+        day_input += max(0, cget("input_tokens", 0) - pget("input_tokens", 0))
+        day_output += max(0, cget("output_tokens", 0) - pget("output_tokens", 0))
+        day_cache_read += max(0, cget("cache_read_tokens", 0) - pget("cache_read_tokens", 0))
+        day_cache_create += max(0, cget("cache_creation_tokens", 0) - pget("cache_creation_tokens", 0))
+
+    return {
+        "date": curr_date,
+        "total_tokens": day_input + day_output + day_cache_read + day_cache_create,
+        "input_tokens": day_input,
+        "output_tokens": day_output,
+        "cache_read_tokens": day_cache_read,
+        "cache_creation_tokens": day_cache_create,
+    }
 
 
 def save_usage_snapshot(model_usage: list[dict]) -> None:
@@ -105,74 +311,78 @@ def save_usage_snapshot(model_usage: list[dict]) -> None:
     if not model_usage:
         return
 
-    today = datetime.now().strftime('%Y-%m-%d')
+    # One clock read serves both the date key and the capture timestamp
+    now = datetime.now()
+    today = now.date().isoformat()
     snapshots = _load_json(USAGE_SNAPSHOTS) or {}
 
     # Store snapshot keyed by date
     snapshots[today] = {
         "model_usage": model_usage,
-        "captured_at": datetime.now().isoformat()
+        "captured_at": now.isoformat()
     }
 
     _save_json(USAGE_SNAPSHOTS, snapshots)
 
+    # Extend the delta sidecar incrementally: only today's row can have
+    # changed, so diff against the latest earlier snapshot instead of
+    # recomputing the whole series
+    earlier = [d for d in snapshots if d < today]
+    if not earlier:
+        return
+    prev = {u["model"]: u for u in snapshots[max(earlier)]["model_usage"]}
+    curr = {u["model"]: u for u in model_usage}
+    row = _day_delta(prev, curr, today)
+
+    deltas = _load_json(DAILY_DELTAS) or []
+    if deltas and deltas[-1].get("date") == today:
+        deltas[-1] = row
+    else:
+        deltas.append(row)
+    _save_json(DAILY_DELTAS, deltas)
+
 
 def get_usage_snapshots() -> dict:
     """Load all usage snapshots."""
     return _load_json(USAGE_SNAPSHOTS) or {}
 
 
-def compute_daily_deltas(days: int = 30) -> list[dict]:
-    """
-    Compute daily token deltas from snapshots.
-    Returns list of daily records with full breakdown.
+def _rebuild_deltas() -> list[dict]:
+    """Recompute the full delta series from snapshots and persist it.
+
+    Fallback for when the sidecar is missing (first run after upgrade,
+    or a cleared cache); normal operation only appends to it.
     """
     snapshots = get_usage_snapshots()
-    if not snapshots:
-        return []
+    if len(snapshots) < 2:
+        return []  # Need at least 2 snapshots to compute deltas
 
-    # Sort dates
     sorted_dates = sorted(snapshots.keys())
-    if len(sorted_dates) < 2:
-        return []  # Need at least 2 snapshots to compute deltas
+    results = []
+    # Each date's model map is built once and carried forward as the next
+    # iteration's "previous" side, halving the dict construction work
+    prev_usage = {u["model"]: u for u in snapshots[sorted_dates[0]]["model_usage"]}
+    for curr_date in sorted_dates[1:]:
+        curr_usage = {u["model"]: u for u in snapshots[curr_date]["model_usage"]}
+        results.append(_day_delta(prev_usage, curr_usage, curr_date))
+        prev_usage = curr_usage
 
-    # Filter to requested day range
-    cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-    sorted_dates = [d for d in sorted_dates if d >= cutoff]
+    _save_json(DAILY_DELTAS, results)
+    return results
 
-    results = []
-    for i in range(1, len(sorted_dates)):
-        prev_date = sorted_dates[i - 1]
-        curr_date = sorted_dates[i]
 
-        prev_usage = {u["model"]: u for u in snapshots[prev_date]["model_usage"]}
-        curr_usage = {u["model"]: u for u in snapshots[curr_date]["model_usage"]}
+def compute_daily_deltas(days: int = 30) -> list[dict]:
+    """
+    Return daily token deltas with full breakdown.
 
-        # Sum deltas across all models for this day
-        day_input = 0
-        day_output = 0
-        day_cache_read = 0
-        day_cache_create = 0
-
-        all_models = set(prev_usage.keys()) | set(curr_usage.keys())
-        for model in all_models:
-            prev = prev_usage.get(model, {})
-            curr = curr_usage.get(model, {})
-
-            day_input += max(0, curr.get("input_tokens", 0) - prev.get("input_tokens", 0))
-            day_output += max(0, curr.get("output_tokens", 0) - prev.get("output_tokens", 0))
-            day_cache_read += max(0, curr.get("cache_read_tokens", 0) - prev.get("cache_read_tokens", 0))
-            day_cache_create += max(0, curr.get("cache_creation_tokens", 0) - prev.get("cache_creation_tokens", 0))
-
-        total = day_input + day_output + day_cache_read + day_cache_create
-
-        results.append({
-            "date": curr_date,
-            "total_tokens": total,
-            "input_tokens": day_input,
-            "output_tokens": day_output,
-            "cache_read_tokens": day_cache_read,
-            "cache_creation_tokens": day_cache_create,
-        })
+    Reads the incrementally maintained sidecar (one row appended per
+    snapshot) rather than re-diffing every snapshot pair per call.
+    """
+    deltas = _load_json(DAILY_DELTAS)
+    if deltas is None:
+        deltas = _rebuild_deltas()
+    if not deltas:
+        return []
 
-    return results
+    cutoff = (date.today() - timedelta(days=days)).isoformat()
+    return [row for row in deltas if row["date"] >= cutoff]
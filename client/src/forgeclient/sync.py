@@ -1,5 +1,5 @@
 """Sync logic for forge client."""
-import httpx
+import atexit
 import logging
 from datetime import datetime, timedelta
 from dataclasses import dataclass
@@ -8,10 +8,42 @@ from .config import load_config, save_config
 from .local_cache import queue_sync, process_pending_syncs, save_server_data, save_usage_snapshot
 from .claude_code import build_sync_payload, get_local_model_usage
 
+try:
+    # Serialize the sync body ourselves (orjson when available) and hand
+    # httpx pre-encoded bytes instead of going through its stdlib-json
+    # `json=` path.
+    from orjson import dumps as _json_dumps
+except ImportError:
+    from json import dumps as _stdlib_dumps
+
+    def _json_dumps(obj: dict) -> bytes:
+        return _stdlib_dumps(obj, separators=(",", ":")).encode()
+
 logger = logging.getLogger(__name__)
 
 SYNC_TIMEOUT = 30.0  # seconds
 
+_client = None  # lazily created httpx.Client
+
+
+def _get_client() -> "httpx.Client":
+    """Shared HTTP client for the CLI's lifetime.
+
+    A stats invocation makes up to four requests (sync plus three stat
+    fetches); reusing one client keeps the TCP/TLS connection alive
+    instead of handshaking per call. httpx itself is imported here so
+    commands that never touch the network skip its import chain.
+    """
+    global _client
+    if _client is None:
+        import httpx
+        _client = httpx.Client(
+            timeout=SYNC_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        atexit.register(_client.close)
+    return _client
+
 
 @dataclass
 class SyncResult:
@@ -21,20 +53,31 @@ class SyncResult:
 
 
 def parse_datetime(s: str) -> datetime:
-    """Parse ISO datetime string."""
-    return datetime.fromisoformat(s.replace("Z", "+00:00").replace("+00:00", ""))
+    """Parse ISO datetime string as naive time.
+
+    fromisoformat handles the Z suffix natively on Python 3.11+, so no
+    string rewriting is needed; any UTC offset is dropped to keep the
+    naive comparison against datetime.now() that callers rely on.
+    """
+    dt = datetime.fromisoformat(s)
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt
 
 
-def maybe_auto_sync(force: bool = False) -> SyncResult:
+def maybe_auto_sync(force: bool = False, config: dict | None = None) -> SyncResult:
     """
     Auto-sync if:
     - force=True, OR
     - last_sync is None, OR
     - last_sync was > 1 hour ago
 
-    Returns SyncResult with status and any error message.
+    Accepts a preloaded config so callers that already hold one don't
+    trigger another load. Returns SyncResult with status and any error
+    message.
     """
-    config = load_config()
+    if config is None:
+        config = load_config()
 
     if not config.get("server_url"):
         return SyncResult(status="skipped", message="Server not configured")
@@ -58,6 +101,8 @@ def maybe_auto_sync(force: bool = False) -> SyncResult:
 
 def do_sync(config: dict) -> SyncResult:
     """Perform the actual sync."""
+    import httpx
+
     server_url = config["server_url"]
     api_key = config["api_key"]
 
@@ -66,16 +111,21 @@ def do_sync(config: dict) -> SyncResult:
     if pending_success > 0:
         logger.info(f"Processed {pending_success} pending syncs")
 
+    # Built and serialized outside the try so the failure path re-queues
+    # this payload (reusing the same bytes) instead of re-scanning the
+    # session files and re-encoding
+    payload = build_sync_payload()
+    body = _json_dumps(payload)
+
     try:
-        payload = build_sync_payload()
-        with httpx.Client(timeout=SYNC_TIMEOUT) as client:
-            response = client.post(
-                f"{server_url}/v1/sync",
-                json=payload,
-                headers={"X-API-Key": api_key}
-            )
-            response.raise_for_status()
-            result = response.json()
+        response = _get_client().post(
+            f"{server_url}/v1/sync",
+            content=body,
+            headers={"X-API-Key": api_key,
+                     "Content-Type": "application/json"}
+        )
+        response.raise_for_status()
+        result = response.json()
 
         save_config({
             **config,
@@ -93,7 +143,7 @@ def do_sync(config: dict) -> SyncResult:
         )
     except httpx.RequestError as e:
         logger.warning(f"Sync failed: {e}")
-        queue_sync(build_sync_payload())
+        queue_sync(payload, body)
         save_config({
             **config,
             "last_sync": datetime.now().isoformat(),
@@ -108,14 +158,16 @@ def do_sync(config: dict) -> SyncResult:
 
 def test_connection(server_url: str, api_key: str) -> tuple[bool, str]:
     """Test server connection and auth. Returns (success, message)."""
+    import httpx
+
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(
-                f"{server_url}/v1/stats/machines",
-                headers={"X-API-Key": api_key}
-            )
-            response.raise_for_status()
-            return True, "Connected"
+        response = _get_client().get(
+            f"{server_url}/v1/stats/machines",
+            headers={"X-API-Key": api_key},
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return True, "Connected"
     except httpx.ConnectError:
         return False, "Could not connect to server"
     except httpx.HTTPStatusError as e:
@@ -133,16 +185,15 @@ def fetch_daily_stats(days: int = 30) -> list[dict] | None:
         return None
 
     try:
-        with httpx.Client(timeout=SYNC_TIMEOUT) as client:
-            response = client.get(
-                f"{config['server_url']}/v1/stats/daily",
-                params={"days": days},
-                headers={"X-API-Key": config["api_key"]}
-            )
-            response.raise_for_status()
-            data = response.json()
-            save_server_data(data)
-            return data.get("days", [])
+        response = _get_client().get(
+            f"{config['server_url']}/v1/stats/daily",
+            params={"days": days},
+            headers={"X-API-Key": config["api_key"]}
+        )
+        response.raise_for_status()
+        data = response.json()
+        save_server_data(data)
+        return data.get("days", [])
     except Exception as e:
         logger.warning(f"Failed to fetch stats: {e}")
         return None
@@ -155,14 +206,13 @@ def fetch_model_stats() -> list[dict] | None:
         return None
 
     try:
-        with httpx.Client(timeout=SYNC_TIMEOUT) as client:
-            response = client.get(
-                f"{config['server_url']}/v1/stats/models",
-                headers={"X-API-Key": config["api_key"]}
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("models", [])
+        response = _get_client().get(
+            f"{config['server_url']}/v1/stats/models",
+            headers={"X-API-Key": config["api_key"]}
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("models", [])
     except Exception as e:
         logger.warning(f"Failed to fetch model stats: {e}")
         return None
@@ -175,13 +225,12 @@ def fetch_totals() -> dict | None:
         return None
 
     try:
-        with httpx.Client(timeout=SYNC_TIMEOUT) as client:
-            response = client.get(
-                f"{config['server_url']}/v1/stats/totals",
-                headers={"X-API-Key": config["api_key"]}
-            )
-            response.raise_for_status()
-            return response.json()
+        response = _get_client().get(
+            f"{config['server_url']}/v1/stats/totals",
+            headers={"X-API-Key": config["api_key"]}
+        )
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logger.warning(f"Failed to fetch totals: {e}")
         return None
@@ -20,4 +20,6 @@ def temp_cache_dir(tmp_path, monkeypatch):
     monkeypatch.setattr(cache_module, "CACHE_DIR", cache_dir)
     monkeypatch.setattr(cache_module, "PENDING_SYNCS", cache_dir / "pending_syncs.json")
     monkeypatch.setattr(cache_module, "LAST_SERVER_DATA", cache_dir / "last_server_data.json")
+    # In-process caches must not leak entries from a previous test's dir
+    monkeypatch.setattr(cache_module, "_pending_cache", None)
     return cache_dir
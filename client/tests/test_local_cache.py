@@ -31,6 +31,26 @@ def test_list_pending(temp_cache_dir):
     assert pending[0]["payload"]["hostname"] == "test1"
 
 
+def test_requeue_after_drain(temp_cache_dir):
+    """Re-queuing a payload after a drain must write it again.
+
+    Regression test: the list_pending cache was revalidated only by
+    mtime, so a drain plus re-queue within one clock tick left the stale
+    pre-drain list matching the dedup fingerprint and dropped the entry.
+    """
+    from forgeclient.local_cache import queue_sync, list_pending, _rewrite_pending
+
+    payload = {"protocol_version": 1, "hostname": "test"}
+    queue_sync(payload)
+    assert len(list_pending()) == 1
+
+    _rewrite_pending([])  # what process_pending_syncs does after posting
+    assert list_pending() == []
+
+    queue_sync(payload)
+    assert len(list_pending()) == 1
+
+
 def test_clear_pending(temp_cache_dir):
     """Test clearing pending syncs."""
     from forgeclient.local_cache import queue_sync, clear_pending, get_pending_count
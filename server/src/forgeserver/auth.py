@@ -5,29 +5,59 @@ import secrets
 from fastapi import HTTPException, Security, Request
 from fastapi.security import APIKeyHeader
 
-api_key_header = APIKeyHeader(name="X-API-Key")
+# auto_error=False so a missing header is our 401 below, not FastAPI's
+# generic 403 — clients then see one status for "no key" and "bad key"
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
-# Simple rate limiting: track request counts per minute
-request_counts: dict[str, list[float]] = {}
+# Token-bucket rate limiting: two floats per client ([tokens, last_seen])
+# instead of a timestamp window. Refill is computed from elapsed time on
+# each request, so the hot path is a dict lookup plus a little float
+# arithmetic with no allocations. The dict is pruned when it grows past
+# the cap so abandoned clients don't accumulate forever.
+request_buckets: dict[str, list[float]] = {}
 RATE_LIMIT = 60  # requests per minute
+MAX_TRACKED_CLIENTS = 10_000
+_REFILL_PER_SECOND = RATE_LIMIT / 60.0
 
 
-async def verify_api_key(request: Request, api_key: str = Security(api_key_header)):
+async def verify_api_key(request: Request, api_key: str | None = Security(api_key_header)):
     """Verify API key and apply rate limiting."""
     expected = os.environ.get("FORGE_API_KEY")
     if not expected:
         raise HTTPException(status_code=500, detail="Server API key not configured")
+    if api_key is None:
+        raise HTTPException(status_code=401, detail="Missing API key")
     if not secrets.compare_digest(api_key, expected):
         raise HTTPException(status_code=401, detail="Invalid API key")
 
     # Rate limiting
     client_ip = request.client.host if request.client else "unknown"
-    now = time.time()
-    if client_ip not in request_counts:
-        request_counts[client_ip] = []
-    request_counts[client_ip] = [t for t in request_counts[client_ip] if now - t < 60]
-    if len(request_counts[client_ip]) >= RATE_LIMIT:
-        raise HTTPException(status_code=429, detail="Rate limit exceeded")
-    request_counts[client_ip].append(now)
+    # monotonic() is a touch cheaper than time() and immune to wall-clock
+    # jumps; the bucket only ever looks at elapsed time, never absolutes
+    now = time.monotonic()
+    bucket = request_buckets.get(client_ip)
+    if bucket is None:
+        if len(request_buckets) >= MAX_TRACKED_CLIENTS:
+            stale = [ip for ip, b in request_buckets.items()
+                     if now - b[1] >= 60]
+            for ip in stale:
+                del request_buckets[ip]
+            if len(request_buckets) >= MAX_TRACKED_CLIENTS:
+                # Every tracked client is recent (e.g. an address-churn
+                # flood): evict the least-recently-seen bucket so the map
+                # stays hard-capped at O(MAX_TRACKED_CLIENTS)
+                oldest = min(request_buckets,
+                             key=lambda ip: request_buckets[ip][1])
+                del request_buckets[oldest]
+        request_buckets[client_ip] = [RATE_LIMIT - 1.0, now]
+    else:
+        tokens = bucket[0] + (now - bucket[1]) * _REFILL_PER_SECOND
+        if tokens > RATE_LIMIT:
+            tokens = RATE_LIMIT
+        bucket[1] = now
+        if tokens < 1.0:
+            bucket[0] = tokens
+            raise HTTPException(status_code=429, detail="Rate limit exceeded")
+        bucket[0] = tokens - 1.0
 
     return api_key
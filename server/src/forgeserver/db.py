@@ -1,11 +1,23 @@
 """SQLite database setup and queries."""
+import functools
 import os
 import logging
+import queue
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 
 from .models import SyncRequest, DailyStatsRecord
 
+try:
+    # orjson decodes the small JSON aggregates below in C; same
+    # optional-dependency arrangement the client modules use
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 DATABASE_PATH = os.environ.get("DATABASE_PATH", "usage.db")
@@ -83,39 +95,237 @@ CREATE TABLE IF NOT EXISTS raw_usage (
 );
 
 CREATE INDEX IF NOT EXISTS idx_daily_activity_date ON daily_activity(date);
-CREATE INDEX IF NOT EXISTS idx_daily_activity_hostname ON daily_activity(hostname);
 CREATE INDEX IF NOT EXISTS idx_daily_usage_date ON daily_usage(date);
-CREATE INDEX IF NOT EXISTS idx_daily_usage_hostname ON daily_usage(hostname);
-CREATE INDEX IF NOT EXISTS idx_model_usage_hostname ON model_usage(hostname);
 CREATE INDEX IF NOT EXISTS idx_raw_usage_timestamp ON raw_usage(timestamp);
 CREATE INDEX IF NOT EXISTS idx_raw_usage_hostname ON raw_usage(hostname);
+
+-- Covering composites for the stats queries' hostname-join + date-range
+-- pattern: the GROUP BY sums read every selected column from the index,
+-- so the table heap is never touched. These subsume the old
+-- single-column hostname indexes, which are dropped below.
+CREATE INDEX IF NOT EXISTS idx_daily_activity_host_date ON daily_activity(
+    hostname, date, message_count, session_count, tool_call_count);
+CREATE INDEX IF NOT EXISTS idx_daily_usage_host_date ON daily_usage(
+    hostname, date, input_tokens, output_tokens,
+    cache_read_tokens, cache_creation_tokens);
+CREATE INDEX IF NOT EXISTS idx_model_usage_host_model ON model_usage(
+    hostname, model, input_tokens, output_tokens,
+    cache_read_tokens, cache_creation_tokens);
+-- Partial index so the is_active = 1 semijoin in every stats query is
+-- itself index-only
+CREATE INDEX IF NOT EXISTS idx_machines_active ON machines(hostname)
+    WHERE is_active = 1;
+DROP INDEX IF EXISTS idx_daily_activity_hostname;
+DROP INDEX IF EXISTS idx_daily_usage_hostname;
+DROP INDEX IF EXISTS idx_model_usage_hostname;
 """
 
 
 def init_db():
     """Initialize database with schema."""
-    with get_db() as conn:
+    # Drop any pooled handles first: tests (and redeploys) replace the
+    # database file, and a kept-open connection would keep serving the
+    # old inode.
+    reset_pool()
+    with get_writer() as conn:
+        if DATABASE_PATH != ":memory:" and "mode=memory" not in DATABASE_PATH:
+            # WAL lets stats reads proceed while a sync writes and fsyncs
+            # far less than the default rollback journal. The setting is
+            # persistent in the database file, so once here is enough.
+            conn.execute("PRAGMA journal_mode = WAL")
         conn.executescript(SCHEMA)
         # Insert initial schema version if not exists
         conn.execute("""
             INSERT OR IGNORE INTO schema_version (version) VALUES (1)
         """)
+        # Refresh planner statistics so the covering indexes get picked
+        conn.execute("ANALYZE")
+    _stats_cache.clear()
+
+
+# Connection pool: one kept-open write connection (SQLite serializes
+# writers anyway) plus a small set of read-only connections, so requests
+# stop paying a connect() — the db, -wal and -shm file opens — each time.
+MAX_READER_CONNECTIONS = min(8, os.cpu_count() or 1)
+
+_writer_conn = None
+_writer_lock = threading.Lock()
+_reader_pool: queue.Queue = queue.Queue()
+_reader_count = 0
+_pool_lock = threading.Lock()
+
+
+def _connect(readonly: bool = False) -> sqlite3.Connection:
+    """Open a configured connection; readers use SQLite's read-only mode."""
+    is_uri = DATABASE_PATH.startswith("file:")
+    if readonly and not is_uri:
+        conn = sqlite3.connect(f"file:{DATABASE_PATH}?mode=ro", uri=True,
+                               check_same_thread=False,
+                               cached_statements=256)
+    else:
+        # URI paths (e.g. the tests' shared in-memory database) pass
+        # through unchanged: their query string already fixes the mode,
+        # and mode=ro cannot be combined with mode=memory.
+        conn = sqlite3.connect(DATABASE_PATH, uri=is_uri,
+                               check_same_thread=False,
+                               cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    # Per-connection pragmas: NORMAL synchronous is durable-enough under
+    # WAL (a crash can drop the tail transactions but never corrupts),
+    # busy_timeout makes contending writers wait instead of erroring,
+    # and temp_store/cache_size keep sorts and hot pages off disk.
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA busy_timeout = 5000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")
+    return conn
+
+
+def reset_pool() -> None:
+    """Close every pooled connection; the next use reopens lazily."""
+    global _writer_conn, _reader_count
+    with _pool_lock:
+        if _writer_conn is not None:
+            _writer_conn.close()
+            _writer_conn = None
+        while True:
+            try:
+                _reader_pool.get_nowait().close()
+            except queue.Empty:
+                break
+        _reader_count = 0
 
 
 @contextmanager
-def get_db():
-    """Get database connection with FK enabled and auto-commit/rollback."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+def get_writer():
+    """Serialized access to the single write connection.
+
+    Commit-on-success/rollback-on-error semantics match the old per-call
+    get_db(); the lock keeps transactions from interleaving on the shared
+    handle.
+    """
+    global _writer_conn
+    with _writer_lock:
+        if _writer_conn is None:
+            _writer_conn = _connect()
+        conn = _writer_conn
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
+@contextmanager
+def get_reader():
+    """Borrow a read-only connection from the pool.
+
+    Under WAL readers never block behind the writer, so stats queries
+    run concurrently with syncs on these kept-open handles.
+    """
+    global _reader_count
+    try:
+        conn = _reader_pool.get_nowait()
+    except queue.Empty:
+        conn = None
+        with _pool_lock:
+            if _reader_count < MAX_READER_CONNECTIONS:
+                conn = _connect(readonly=True)
+                _reader_count += 1
+        if conn is None:
+            conn = _reader_pool.get()  # wait for a handle to come back
     try:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
     finally:
-        conn.close()
+        _reader_pool.put(conn)
+
+
+# The aggregate stats only change when a writer runs, and sync_usage is
+# the only in-process writer worth worrying about — so reads are served
+# from a short-TTL cache that every write path clears. The TTL bounds
+# staleness across processes sharing one database file.
+_STATS_TTL = 30.0  # seconds
+_stats_cache: dict = {}
+
+
+def _ttl_cached(name: str):
+    """Cache a stats read under (name, args) for _STATS_TTL seconds."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args):
+            key = (name, args)
+            now = time.monotonic()
+            hit = _stats_cache.get(key)
+            if hit is not None and now - hit[0] < _STATS_TTL:
+                return hit[1]
+            value = fn(*args)
+            _stats_cache[key] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
+
+# Hot upsert SQL hoisted to module scope: sqlite3's statement cache
+# is keyed by the exact string object's value, so reusing one interned
+# literal per statement keeps the prepared plans warm across requests.
+_SQL_UPSERT_DAILY_ACTIVITY = """
+    INSERT INTO daily_activity
+        (hostname, date, message_count, session_count, tool_call_count, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(hostname, date) DO UPDATE SET
+        message_count = excluded.message_count,
+        session_count = excluded.session_count,
+        tool_call_count = excluded.tool_call_count,
+        updated_at = excluded.updated_at
+"""
+
+_SQL_UPSERT_DAILY_USAGE = """
+    INSERT INTO daily_usage
+        (hostname, date, input_tokens, output_tokens,
+         cache_read_tokens, cache_creation_tokens, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(hostname, date) DO UPDATE SET
+        input_tokens = excluded.input_tokens,
+        output_tokens = excluded.output_tokens,
+        cache_read_tokens = excluded.cache_read_tokens,
+        cache_creation_tokens = excluded.cache_creation_tokens,
+        updated_at = excluded.updated_at
+"""
+
+_SQL_UPSERT_MODEL_USAGE = """
+    INSERT INTO model_usage
+        (hostname, model, input_tokens, output_tokens,
+         cache_read_tokens, cache_creation_tokens, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(hostname, model) DO UPDATE SET
+        input_tokens = excluded.input_tokens,
+        output_tokens = excluded.output_tokens,
+        cache_read_tokens = excluded.cache_read_tokens,
+        cache_creation_tokens = excluded.cache_creation_tokens,
+        updated_at = excluded.updated_at
+"""
+
+# raw_usage rows are packed into multi-row VALUES statements (built from
+# this prefix/suffix pair), one VDBE dispatch per batch instead of per
+# row. 100 rows x 7 parameters stays well under SQLite's default
+# 999-variable limit.
+_RAW_BATCH_ROWS = 100
+
+_SQL_UPSERT_RAW_USAGE_PREFIX = """
+    INSERT INTO raw_usage
+        (hostname, timestamp, model, input_tokens, output_tokens,
+         cache_read_tokens, cache_creation_tokens)
+    VALUES """
+
+_SQL_UPSERT_RAW_USAGE_SUFFIX = """
+    ON CONFLICT(hostname, timestamp, model) DO UPDATE SET
+        input_tokens = excluded.input_tokens,
+        output_tokens = excluded.output_tokens,
+        cache_read_tokens = excluded.cache_read_tokens,
+        cache_creation_tokens = excluded.cache_creation_tokens
+"""
 
 
 def sync_usage(request: SyncRequest) -> tuple[int, bool]:
@@ -125,144 +335,149 @@ def sync_usage(request: SyncRequest) -> tuple[int, bool]:
     """
     count = 0
     registered = False
-
-    with get_db() as conn:
-        # Check if machine exists
-        existing = conn.execute(
-            "SELECT id FROM machines WHERE hostname = ?",
-            (request.hostname,)
-        ).fetchone()
-        registered = existing is None
-
-        # Upsert machine
-        conn.execute("""
-            INSERT INTO machines (hostname)
-            VALUES (?)
-            ON CONFLICT(hostname) DO UPDATE SET
-                last_sync = datetime('now'),
-                is_active = 1
-        """, (request.hostname,))
-
-        # Upsert daily activity
-        for record in request.daily_activity:
-            conn.execute("""
-                INSERT INTO daily_activity
-                    (hostname, date, message_count, session_count, tool_call_count, updated_at)
-                VALUES (?, ?, ?, ?, ?, datetime('now'))
-                ON CONFLICT(hostname, date) DO UPDATE SET
-                    message_count = excluded.message_count,
-                    session_count = excluded.session_count,
-                    tool_call_count = excluded.tool_call_count,
-                    updated_at = datetime('now')
-            """, (request.hostname, record.date, record.message_count,
-                  record.session_count, record.tool_call_count))
-            count += 1
+    # One clock read per sync, bound as a parameter: the SQL used to call
+    # datetime('now') twice per row, in the same UTC second-resolution
+    # format this produces
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+    with get_writer() as conn:
+        # Take the write lock up front. The implicit deferred transaction
+        # would upgrade read->write at the first INSERT, which can raise
+        # SQLITE_BUSY against another process mid-transaction; with
+        # IMMEDIATE, busy_timeout governs a single wait here at BEGIN.
+        conn.execute("BEGIN IMMEDIATE")
+
+        # Register-or-touch the machine without the old existence SELECT:
+        # RETURNING yields a row only when the INSERT actually inserted,
+        # which doubles as the "is this machine new" check
+        inserted = conn.execute("""
+            INSERT INTO machines (hostname, last_sync)
+            VALUES (?, ?)
+            ON CONFLICT(hostname) DO NOTHING
+            RETURNING id
+        """, (request.hostname, now)).fetchone()
+        registered = inserted is not None
+        if not registered:
+            conn.execute(
+                "UPDATE machines SET last_sync = ?, is_active = 1"
+                " WHERE hostname = ?",
+                (now, request.hostname))
+
+        # Each section batches its rows through executemany so SQLite
+        # prepares the statement once and binds per row, instead of paying
+        # parse + VDBE setup on every record
+        hostname = request.hostname
+
+        # Upsert daily activity. Empty sections are skipped outright —
+        # an hourly heartbeat sync with no new data is the common case,
+        # and each skip saves a statement prepare inside the transaction
+        if request.daily_activity:
+            conn.executemany(_SQL_UPSERT_DAILY_ACTIVITY, [
+                (hostname, r.date, r.message_count, r.session_count,
+                 r.tool_call_count, now)
+                for r in request.daily_activity])
+            count += len(request.daily_activity)
 
         # Upsert daily usage (full token breakdown)
-        for record in request.daily_usage:
-            conn.execute("""
-                INSERT INTO daily_usage
-                    (hostname, date, input_tokens, output_tokens,
-                     cache_read_tokens, cache_creation_tokens, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
-                ON CONFLICT(hostname, date) DO UPDATE SET
-                    input_tokens = excluded.input_tokens,
-                    output_tokens = excluded.output_tokens,
-                    cache_read_tokens = excluded.cache_read_tokens,
-                    cache_creation_tokens = excluded.cache_creation_tokens,
-                    updated_at = datetime('now')
-            """, (request.hostname, record.date, record.input_tokens,
-                  record.output_tokens, record.cache_read_tokens,
-                  record.cache_creation_tokens))
-            count += 1
+        if request.daily_usage:
+            conn.executemany(_SQL_UPSERT_DAILY_USAGE, [
+                (hostname, r.date, r.input_tokens, r.output_tokens,
+                 r.cache_read_tokens, r.cache_creation_tokens, now)
+                for r in request.daily_usage])
+            count += len(request.daily_usage)
 
         # Upsert model usage
-        for record in request.model_usage:
-            conn.execute("""
-                INSERT INTO model_usage
-                    (hostname, model, input_tokens, output_tokens,
-                     cache_read_tokens, cache_creation_tokens, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
-                ON CONFLICT(hostname, model) DO UPDATE SET
-                    input_tokens = excluded.input_tokens,
-                    output_tokens = excluded.output_tokens,
-                    cache_read_tokens = excluded.cache_read_tokens,
-                    cache_creation_tokens = excluded.cache_creation_tokens,
-                    updated_at = datetime('now')
-            """, (request.hostname, record.model, record.input_tokens,
-                  record.output_tokens, record.cache_read_tokens,
-                  record.cache_creation_tokens))
-            count += 1
-
-        for record in request.raw_usage:
-            conn.execute("""
-                INSERT INTO raw_usage
-                    (hostname, timestamp, model, input_tokens, output_tokens,
-                     cache_read_tokens, cache_creation_tokens)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(hostname, timestamp, model) DO UPDATE SET
-                    input_tokens = excluded.input_tokens,
-                    output_tokens = excluded.output_tokens,
-                    cache_read_tokens = excluded.cache_read_tokens,
-                    cache_creation_tokens = excluded.cache_creation_tokens
-            """, (request.hostname, record.timestamp, record.model,
-                  record.input_tokens, record.output_tokens,
-                  record.cache_read_tokens, record.cache_creation_tokens))
-            count += 1
+        if request.model_usage:
+            conn.executemany(_SQL_UPSERT_MODEL_USAGE, [
+                (hostname, r.model, r.input_tokens, r.output_tokens,
+                 r.cache_read_tokens, r.cache_creation_tokens, now)
+                for r in request.model_usage])
+            count += len(request.model_usage)
+
+        # raw_usage is the largest table (one row per message), so it gets
+        # the extra step beyond executemany: batches of rows per statement
+        raw_rows = [
+            (hostname, r.timestamp, r.model, r.input_tokens,
+             r.output_tokens, r.cache_read_tokens, r.cache_creation_tokens)
+            for r in request.raw_usage]
+        for start in range(0, len(raw_rows), _RAW_BATCH_ROWS):
+            chunk = raw_rows[start:start + _RAW_BATCH_ROWS]
+            conn.execute(
+                _SQL_UPSERT_RAW_USAGE_PREFIX
+                + ", ".join(("(?, ?, ?, ?, ?, ?, ?)",) * len(chunk))
+                + _SQL_UPSERT_RAW_USAGE_SUFFIX,
+                [value for row in chunk for value in row])
+        count += len(raw_rows)
 
         logger.info(f"Synced {count} records for {request.hostname}")
 
+    _stats_cache.clear()
     return count, registered
 
 
+@_ttl_cached("daily")
 def get_daily_stats(days: int = 30) -> list[DailyStatsRecord]:
     """Get aggregated daily stats for active machines."""
-    with get_db() as conn:
-        # Query usage aggregated by date (full breakdown)
+    with get_reader() as conn:
+        # The cutoff is computed here and bound as a constant; the SQL
+        # date('now', ?) it replaces re-ran the date function per
+        # comparison and hid the bound from the planner
+        cutoff = (datetime.now(timezone.utc).date()
+                  - timedelta(days=days)).isoformat()
+        # One round trip: usage and activity aggregate in their own CTEs
+        # and join on date, so SQLite streams the merged rows and Python
+        # skips the lookup-map it used to build from a second query. The
+        # LEFT JOIN keeps the old shape — days exist only if usage does.
         rows = conn.execute("""
+            WITH u AS (
+                SELECT
+                    du.date,
+                    SUM(du.input_tokens) as input_tokens,
+                    SUM(du.output_tokens) as output_tokens,
+                    SUM(du.cache_read_tokens) as cache_read_tokens,
+                    SUM(du.cache_creation_tokens) as cache_creation_tokens,
+                    json_group_array(DISTINCT du.hostname) as machines
+                FROM daily_usage du
+                JOIN machines m ON du.hostname = m.hostname AND m.is_active = 1
+                WHERE du.date >= ?
+                GROUP BY du.date
+            ), a AS (
+                SELECT
+                    da.date,
+                    SUM(da.message_count) as message_count,
+                    SUM(da.session_count) as session_count,
+                    SUM(da.tool_call_count) as tool_call_count
+                FROM daily_activity da
+                JOIN machines m ON da.hostname = m.hostname AND m.is_active = 1
+                WHERE da.date >= ?
+                GROUP BY da.date
+            )
             SELECT
-                du.date,
-                SUM(du.input_tokens) as input_tokens,
-                SUM(du.output_tokens) as output_tokens,
-                SUM(du.cache_read_tokens) as cache_read_tokens,
-                SUM(du.cache_creation_tokens) as cache_creation_tokens,
-                GROUP_CONCAT(DISTINCT du.hostname) as machines
-            FROM daily_usage du
-            JOIN machines m ON du.hostname = m.hostname AND m.is_active = 1
-            WHERE du.date >= date('now', ?)
-            GROUP BY du.date
-            ORDER BY du.date ASC
-        """, (f'-{days} days',)).fetchall()
-
-        # Query activity aggregated by date
-        activity_rows = conn.execute("""
-            SELECT
-                da.date,
-                SUM(da.message_count) as message_count,
-                SUM(da.session_count) as session_count,
-                SUM(da.tool_call_count) as tool_call_count
-            FROM daily_activity da
-            JOIN machines m ON da.hostname = m.hostname AND m.is_active = 1
-            WHERE da.date >= date('now', ?)
-            GROUP BY da.date
-        """, (f'-{days} days',)).fetchall()
-
-        # Build activity lookup (convert sqlite3.Row to dict for .get() support)
-        activity_map = {r['date']: dict(r) for r in activity_rows}
-
+                u.date, u.input_tokens, u.output_tokens,
+                u.cache_read_tokens, u.cache_creation_tokens, u.machines,
+                (u.input_tokens + u.output_tokens + u.cache_read_tokens
+                 + u.cache_creation_tokens) as total_tokens,
+                COALESCE(a.message_count, 0) as message_count,
+                COALESCE(a.session_count, 0) as session_count,
+                COALESCE(a.tool_call_count, 0) as tool_call_count
+            FROM u LEFT JOIN a ON a.date = u.date
+            ORDER BY u.date ASC
+        """, (cutoff, cutoff)).fetchall()
+
+        # model_construct skips re-validation; these rows come straight
+        # from our own aggregates
         return [
-            DailyStatsRecord(
+            DailyStatsRecord.model_construct(
                 date=row['date'],
-                total_tokens=(row['input_tokens'] + row['output_tokens'] +
-                              row['cache_read_tokens'] + row['cache_creation_tokens']),
+                total_tokens=row['total_tokens'],
                 input_tokens=row['input_tokens'],
                 output_tokens=row['output_tokens'],
                 cache_read_tokens=row['cache_read_tokens'],
                 cache_creation_tokens=row['cache_creation_tokens'],
-                message_count=activity_map.get(row['date'], {}).get('message_count', 0) or 0,
-                session_count=activity_map.get(row['date'], {}).get('session_count', 0) or 0,
-                tool_call_count=activity_map.get(row['date'], {}).get('tool_call_count', 0) or 0,
-                machines=row['machines'].split(',') if row['machines'] else []
+                message_count=row['message_count'],
+                session_count=row['session_count'],
+                tool_call_count=row['tool_call_count'],
+                machines=_json_loads(row['machines'])
             )
             for row in rows
         ]
@@ -270,7 +485,7 @@ def get_daily_stats(days: int = 30) -> list[DailyStatsRecord]:
 
 def get_machines() -> list[dict]:
     """Get all machines with their status."""
-    with get_db() as conn:
+    with get_reader() as conn:
         rows = conn.execute("""
             SELECT hostname, first_seen, last_sync, is_active
             FROM machines
@@ -279,37 +494,32 @@ def get_machines() -> list[dict]:
         return [dict(r) for r in rows]
 
 
+@_ttl_cached("models")
 def get_model_stats(days: int = 30) -> list[dict]:
     """Get usage aggregated by model."""
-    with get_db() as conn:
+    with get_reader() as conn:
         rows = conn.execute("""
             SELECT
                 mu.model,
                 SUM(mu.input_tokens) as input_tokens,
                 SUM(mu.output_tokens) as output_tokens,
                 SUM(mu.cache_read_tokens) as cache_read_tokens,
-                SUM(mu.cache_creation_tokens) as cache_creation_tokens
+                SUM(mu.cache_creation_tokens) as cache_creation_tokens,
+                (SUM(mu.input_tokens) + SUM(mu.output_tokens)
+                 + SUM(mu.cache_read_tokens)
+                 + SUM(mu.cache_creation_tokens)) as total_tokens
             FROM model_usage mu
             JOIN machines m ON mu.hostname = m.hostname AND m.is_active = 1
             GROUP BY mu.model
             ORDER BY (SUM(mu.input_tokens) + SUM(mu.output_tokens)) DESC
         """).fetchall()
-        return [
-            {
-                "model": r['model'],
-                "input_tokens": r['input_tokens'],
-                "output_tokens": r['output_tokens'],
-                "cache_read_tokens": r['cache_read_tokens'],
-                "cache_creation_tokens": r['cache_creation_tokens'],
-                "total_tokens": r['input_tokens'] + r['output_tokens'] + r['cache_read_tokens'] + r['cache_creation_tokens']
-            }
-            for r in rows
-        ]
+        return [dict(r) for r in rows]
 
 
+@_ttl_cached("totals")
 def get_totals() -> dict:
     """Get all-time totals."""
-    with get_db() as conn:
+    with get_reader() as conn:
         tokens = conn.execute("""
             SELECT
                 COALESCE(SUM(input_tokens + output_tokens + cache_read_tokens + cache_creation_tokens), 0) as total
@@ -347,7 +557,7 @@ def get_totals() -> dict:
 
 def delete_machine(hostname: str, hard: bool = False) -> bool:
     """Delete or deactivate a machine. Returns True if found."""
-    with get_db() as conn:
+    with get_writer() as conn:
         if hard:
             result = conn.execute(
                 "DELETE FROM machines WHERE hostname = ?", (hostname,)
@@ -356,53 +566,54 @@ def delete_machine(hostname: str, hard: bool = False) -> bool:
             result = conn.execute(
                 "UPDATE machines SET is_active = 0 WHERE hostname = ?", (hostname,)
             )
-        return result.rowcount > 0
+    _stats_cache.clear()
+    return result.rowcount > 0
 
 
 def reactivate_machine(hostname: str) -> bool:
     """Reactivate a soft-deleted machine. Returns True if found."""
-    with get_db() as conn:
+    with get_writer() as conn:
         result = conn.execute(
             "UPDATE machines SET is_active = 1 WHERE hostname = ?", (hostname,)
         )
-        return result.rowcount > 0
+    _stats_cache.clear()
+    return result.rowcount > 0
 
 
 def get_machine_stats(hostname: str, days: int = 30) -> list[DailyStatsRecord]:
     """Get daily stats for a single machine."""
-    with get_db() as conn:
+    with get_reader() as conn:
+        # Same single-round-trip shape as get_daily_stats, scoped to one
+        # hostname (no aggregation needed — rows are unique per day)
+        cutoff = (datetime.now(timezone.utc).date()
+                  - timedelta(days=days)).isoformat()
         rows = conn.execute("""
             SELECT
-                du.date,
-                du.input_tokens,
-                du.output_tokens,
-                du.cache_read_tokens,
-                du.cache_creation_tokens
+                du.date, du.input_tokens, du.output_tokens,
+                du.cache_read_tokens, du.cache_creation_tokens,
+                (du.input_tokens + du.output_tokens + du.cache_read_tokens
+                 + du.cache_creation_tokens) as total_tokens,
+                COALESCE(da.message_count, 0) as message_count,
+                COALESCE(da.session_count, 0) as session_count,
+                COALESCE(da.tool_call_count, 0) as tool_call_count
             FROM daily_usage du
-            WHERE du.hostname = ? AND du.date >= date('now', ?)
+            LEFT JOIN daily_activity da
+                ON da.hostname = du.hostname AND da.date = du.date
+            WHERE du.hostname = ? AND du.date >= ?
             ORDER BY du.date ASC
-        """, (hostname, f'-{days} days')).fetchall()
-
-        activity_rows = conn.execute("""
-            SELECT date, message_count, session_count, tool_call_count
-            FROM daily_activity
-            WHERE hostname = ? AND date >= date('now', ?)
-        """, (hostname, f'-{days} days')).fetchall()
-
-        activity_map = {r['date']: dict(r) for r in activity_rows}
+        """, (hostname, cutoff)).fetchall()
 
         return [
-            DailyStatsRecord(
+            DailyStatsRecord.model_construct(
                 date=row['date'],
-                total_tokens=(row['input_tokens'] + row['output_tokens'] +
-                              row['cache_read_tokens'] + row['cache_creation_tokens']),
+                total_tokens=row['total_tokens'],
                 input_tokens=row['input_tokens'],
                 output_tokens=row['output_tokens'],
                 cache_read_tokens=row['cache_read_tokens'],
                 cache_creation_tokens=row['cache_creation_tokens'],
-                message_count=activity_map.get(row['date'], {}).get('message_count', 0) or 0,
-                session_count=activity_map.get(row['date'], {}).get('session_count', 0) or 0,
-                tool_call_count=activity_map.get(row['date'], {}).get('tool_call_count', 0) or 0,
+                message_count=row['message_count'],
+                session_count=row['session_count'],
+                tool_call_count=row['tool_call_count'],
                 machines=[hostname]
             )
             for row in rows
@@ -4,11 +4,20 @@ import sys
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 
-from .db import init_db, get_db
+from .db import init_db, get_reader
 from .auth import verify_api_key
 from .models import HealthResponse
 from .routers import sync, stats, machines
 
+try:
+    # orjson serializes the big stats lists several times faster than the
+    # default JSONResponse; fall back when it isn't installed (it is an
+    # optional speedup, not a dependency)
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as _DefaultResponse
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,7 +29,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Forge Server",
     version="0.1.0",
-    description="Central server for Claude Code usage tracking"
+    description="Central server for Claude Code usage tracking",
+    default_response_class=_DefaultResponse
 )
 
 # CORS
@@ -42,9 +52,9 @@ async def startup():
 
 # Health check (no auth)
 @app.get("/health", response_model=HealthResponse)
-async def health_check():
+def health_check():
     try:
-        with get_db() as conn:
+        with get_reader() as conn:
             version = conn.execute(
                 "SELECT MAX(version) FROM schema_version"
             ).fetchone()[0]
@@ -1,11 +1,28 @@
 """Pydantic schemas for request/response models."""
 from pydantic import BaseModel, Field, field_validator
-from datetime import datetime
+from datetime import date
 
 PROTOCOL_VERSION = 1
 MAX_SYNC_DAYS = 365
 
 
+def _validate_sync_date(v: str) -> str:
+    """Shared date check for sync records.
+
+    date.fromisoformat is the C fast path (several times cheaper than the
+    strptime this replaces), and one today() read covers both range
+    checks instead of two datetime.now() calls per record — this runs up
+    to MAX_SYNC_DAYS times per table in a full sync.
+    """
+    parsed = date.fromisoformat(v)
+    today = date.today()
+    if (today - parsed).days > MAX_SYNC_DAYS:
+        raise ValueError(f'Date too old (max {MAX_SYNC_DAYS} days)')
+    if parsed > today:
+        raise ValueError('Future dates not allowed')
+    return v
+
+
 # === Request Models ===
 
 class DailyActivityRecord(BaseModel):
@@ -15,15 +32,7 @@ class DailyActivityRecord(BaseModel):
     session_count: int = Field(ge=0, default=0)
     tool_call_count: int = Field(ge=0, default=0)
 
-    @field_validator('date')
-    @classmethod
-    def validate_date_format(cls, v):
-        parsed = datetime.strptime(v, '%Y-%m-%d')
-        if (datetime.now() - parsed).days > MAX_SYNC_DAYS:
-            raise ValueError(f'Date too old (max {MAX_SYNC_DAYS} days)')
-        if parsed.date() > datetime.now().date():
-            raise ValueError('Future dates not allowed')
-        return v
+    validate_date_format = field_validator('date')(_validate_sync_date)
 
 
 class DailyUsageRecord(BaseModel):
@@ -34,15 +43,7 @@ class DailyUsageRecord(BaseModel):
     cache_read_tokens: int = Field(ge=0, default=0)
     cache_creation_tokens: int = Field(ge=0, default=0)
 
-    @field_validator('date')
-    @classmethod
-    def validate_date_format(cls, v):
-        parsed = datetime.strptime(v, '%Y-%m-%d')
-        if (datetime.now() - parsed).days > MAX_SYNC_DAYS:
-            raise ValueError(f'Date too old (max {MAX_SYNC_DAYS} days)')
-        if parsed.date() > datetime.now().date():
-            raise ValueError('Future dates not allowed')
-        return v
+    validate_date_format = field_validator('date')(_validate_sync_date)
 
 
 class ModelUsageRecord(BaseModel):
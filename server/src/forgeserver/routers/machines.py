@@ -7,7 +7,7 @@ router = APIRouter(prefix="/machines", tags=["machines"])
 
 
 @router.delete("/{hostname}")
-async def remove_machine(hostname: str, hard: bool = Query(default=False)):
+def remove_machine(hostname: str, hard: bool = Query(default=False)):
     """
     Remove a machine.
     - hard=False (default): Soft delete, excludes from stats but keeps data
@@ -19,7 +19,7 @@ async def remove_machine(hostname: str, hard: bool = Query(default=False)):
 
 
 @router.post("/{hostname}/reactivate")
-async def reactivate(hostname: str):
+def reactivate(hostname: str):
     """Reactivate a soft-deleted machine."""
     if reactivate_machine(hostname):
         return {"status": "reactivated"}
@@ -15,14 +15,14 @@ router = APIRouter(prefix="/stats", tags=["stats"])
 
 
 @router.get("/daily", response_model=DailyStatsResponse)
-async def daily_stats(days: int = Query(default=30, ge=1, le=365)):
+def daily_stats(days: int = Query(default=30, ge=1, le=365)):
     """Get aggregated daily usage across all active machines."""
     data = get_daily_stats(days)
     return DailyStatsResponse(days=data)
 
 
 @router.get("/machines", response_model=MachinesResponse)
-async def list_machines():
+def list_machines():
     """List all registered machines."""
     data = get_machines()
     return MachinesResponse(
@@ -39,7 +39,7 @@ async def list_machines():
 
 
 @router.get("/models", response_model=ModelsResponse)
-async def model_stats(days: int = Query(default=30, ge=1, le=365)):
+def model_stats(days: int = Query(default=30, ge=1, le=365)):
     """Get usage breakdown by model."""
     data = get_model_stats(days)
     return ModelsResponse(
@@ -58,14 +58,14 @@ async def model_stats(days: int = Query(default=30, ge=1, le=365)):
 
 
 @router.get("/totals", response_model=TotalsResponse)
-async def totals():
+def totals():
     """Get all-time usage totals."""
     data = get_totals()
     return TotalsResponse(**data)
 
 
 @router.get("/machine/{hostname}", response_model=DailyStatsResponse)
-async def machine_stats(hostname: str, days: int = Query(default=30, ge=1, le=365)):
+def machine_stats(hostname: str, days: int = Query(default=30, ge=1, le=365)):
     """Get daily stats for a single machine."""
     data = get_machine_stats(hostname, days)
     return DailyStatsResponse(days=data)
@@ -8,8 +8,11 @@ from ..models import SyncRequest, SyncResponse, PROTOCOL_VERSION
 router = APIRouter(tags=["sync"])
 
 
+# Handlers here are plain `def` on purpose: the DB calls are synchronous
+# SQLite work, and FastAPI runs sync handlers on its threadpool instead
+# of blocking the event loop for the whole transaction.
 @router.post("/sync", response_model=SyncResponse)
-async def sync(request: SyncRequest):
+def sync(request: SyncRequest):
     """
     Receive and store usage data from a client.
     All data is upserted (idempotent).
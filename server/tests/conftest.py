@@ -1,31 +1,77 @@
 """Test fixtures for server tests."""
 import pytest
-import tempfile
 import os
+import httpx
 from fastapi.testclient import TestClient
 
+# Deletion order respects the FK from the data tables to machines
+_TABLES = ("raw_usage", "model_usage", "daily_usage", "daily_activity",
+           "machines")
 
-@pytest.fixture
-def temp_db():
-    """Create temporary database."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        os.environ["DATABASE_PATH"] = f.name
-        # Initialize the database schema
-        from forgeserver.db import init_db
-        init_db()
-        yield f.name
-    os.unlink(f.name)
 
+@pytest.fixture(scope="session")
+def db_path():
+    """One shared in-memory database for the session; schema built once.
 
-@pytest.fixture
+    cache=shared lets the pool's writer and readers see the same
+    database; it lives exactly as long as the pool holds a connection,
+    so teardown is just closing the pool — no files to unlink.
+    """
+    uri = "file:forgeserver-tests?mode=memory&cache=shared"
+    os.environ["DATABASE_PATH"] = uri
+    # Import after the env var is set — forgeserver.db reads it at import
+    from forgeserver.db import init_db, reset_pool
+    init_db()
+    yield uri
+    reset_pool()
+
+
+@pytest.fixture(autouse=True)
+def temp_db(db_path):
+    """Hand each test the shared database, emptied in one transaction.
+
+    Autouse: emptying the tables is what isolates tests from each other
+    now that the client and database live for the whole session.
+    """
+    import forgeserver.db as db
+    with db.get_writer() as conn:
+        for table in _TABLES:
+            conn.execute(f"DELETE FROM {table}")
+    db._stats_cache.clear()
+    return db_path
+
+
+@pytest.fixture(scope="session")
 def api_key():
     """Set test API key."""
     os.environ["FORGE_API_KEY"] = "test-key-12345"
     return "test-key-12345"
 
 
-@pytest.fixture
-def client(temp_db, api_key):
-    """Create test client."""
+@pytest.fixture(scope="session")
+def auth_headers(api_key):
+    """One headers dict for the session; tests must not mutate it."""
+    return {"X-API-Key": api_key}
+
+
+@pytest.fixture(scope="session")
+def client(db_path, api_key):
+    """One test client for the session; app wiring happens once."""
     from forgeserver.main import app
     return TestClient(app)
+
+
+@pytest.fixture
+async def aclient(db_path, api_key):
+    """In-process async client.
+
+    Talks to the app over ASGITransport on the test's own event loop,
+    so requests skip TestClient's thread/portal hop and tests can issue
+    them concurrently with asyncio.gather.
+    """
+    from forgeserver.main import app
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as ac:
+        yield ac
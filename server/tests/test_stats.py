@@ -1,17 +1,17 @@
 """Tests for stats endpoints."""
 
 
-def test_daily_stats_empty(client, api_key):
+def test_daily_stats_empty(client, auth_headers):
     """Test daily stats with no data."""
     response = client.get(
         "/v1/stats/daily",
-        headers={"X-API-Key": api_key}
+        headers=auth_headers
     )
     assert response.status_code == 200
     assert response.json()["days"] == []
 
 
-def test_daily_stats_with_data(client, api_key):
+def test_daily_stats_with_data(client, auth_headers):
     """Test daily stats after syncing data."""
     # First sync some data
     client.post(
@@ -23,13 +23,13 @@ def test_daily_stats_with_data(client, api_key):
             "daily_usage": [{"date": "2026-01-07", "input_tokens": 400, "output_tokens": 600, "cache_read_tokens": 0, "cache_creation_tokens": 0}],
             "model_usage": []
         },
-        headers={"X-API-Key": api_key}
+        headers=auth_headers
     )
 
     # Then query stats
     response = client.get(
         "/v1/stats/daily?days=30",
-        headers={"X-API-Key": api_key}
+        headers=auth_headers
     )
     assert response.status_code == 200
     days = response.json()["days"]
@@ -43,53 +43,53 @@ def test_daily_stats_with_data(client, api_key):
         assert day["message_count"] == 10
 
 
-def test_machines_list(client, api_key):
+def test_machines_list(client, auth_headers):
     """Test listing machines."""
     # Sync to register a machine
     client.post(
         "/v1/sync",
         json={"protocol_version": 1, "hostname": "test-machine", "daily_activity": [], "daily_usage": [], "model_usage": []},
-        headers={"X-API-Key": api_key}
+        headers=auth_headers
     )
 
-    response = client.get("/v1/stats/machines", headers={"X-API-Key": api_key})
+    response = client.get("/v1/stats/machines", headers=auth_headers)
     assert response.status_code == 200
     machines = response.json()["machines"]
     assert any(m["hostname"] == "test-machine" for m in machines)
 
 
-def test_machine_soft_delete(client, api_key):
+def test_machine_soft_delete(client, auth_headers):
     """Test soft deleting a machine."""
     # Register machine
     client.post(
         "/v1/sync",
         json={"protocol_version": 1, "hostname": "to-delete", "daily_activity": [], "daily_usage": [], "model_usage": []},
-        headers={"X-API-Key": api_key}
+        headers=auth_headers
     )
 
     # Soft delete
-    response = client.delete("/v1/machines/to-delete", headers={"X-API-Key": api_key})
+    response = client.delete("/v1/machines/to-delete", headers=auth_headers)
     assert response.status_code == 200
     assert response.json()["hard"] is False
 
     # Machine should be inactive
-    machines = client.get("/v1/stats/machines", headers={"X-API-Key": api_key}).json()["machines"]
+    machines = client.get("/v1/stats/machines", headers=auth_headers).json()["machines"]
     machine = next(m for m in machines if m["hostname"] == "to-delete")
     assert machine["is_active"] is False
 
     # Reactivate
-    response = client.post("/v1/machines/to-delete/reactivate", headers={"X-API-Key": api_key})
+    response = client.post("/v1/machines/to-delete/reactivate", headers=auth_headers)
     assert response.status_code == 200
 
     # Should be active again
-    machines = client.get("/v1/stats/machines", headers={"X-API-Key": api_key}).json()["machines"]
+    machines = client.get("/v1/stats/machines", headers=auth_headers).json()["machines"]
     machine = next(m for m in machines if m["hostname"] == "to-delete")
     assert machine["is_active"] is True
 
 
-def test_totals(client, api_key):
+def test_totals(client, auth_headers):
     """Test totals endpoint."""
-    response = client.get("/v1/stats/totals", headers={"X-API-Key": api_key})
+    response = client.get("/v1/stats/totals", headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
     assert "total_tokens" in data
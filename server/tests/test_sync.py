@@ -1,64 +1,100 @@
 """Tests for sync endpoint."""
+import asyncio
+import itertools
 
+import pytest
 
-def test_sync_creates_machine(client, api_key):
-    """Test that sync creates machine on first call."""
-    import uuid
-    unique_hostname = f"test-machine-{uuid.uuid4().hex[:8]}"
-    response = client.post(
-        "/v1/sync",
-        json={
-            "protocol_version": 1,
-            "hostname": unique_hostname,
-            "daily_activity": [],
-            "daily_usage": [],
-            "model_usage": []
-        },
-        headers={"X-API-Key": api_key}
-    )
-    assert response.status_code == 200
-    data = response.json()
-    assert data["status"] == "success"
-    assert data["machine_registered"] is True
+try:
+    # Same optional speedup the client and server use for serializing.
+    import orjson
+
+    def _encode(payload):
+        """Serialize a request body once; posts send the bytes directly."""
+        return orjson.dumps(payload)
+except ImportError:
+    import json
+
+    def _encode(payload):
+        """Serialize a request body once; posts send the bytes directly."""
+        return json.dumps(payload).encode()
+
+# Monotonic suffix for tests that need a hostname nothing else has used.
+_hostname_counter = itertools.count()
+
+# Shared request skeleton; tests copy it and override what they need.
+_BASE_PAYLOAD = {
+    "protocol_version": 1,
+    "hostname": "test-machine",
+    "daily_activity": [],
+    "daily_usage": [],
+    "model_usage": [],
+}
 
+_DATA_RECORDS = {
+    "daily_activity": [{"date": "2026-01-07", "message_count": 10, "session_count": 1, "tool_call_count": 5}],
+    "daily_usage": [{"date": "2026-01-07", "input_tokens": 500, "output_tokens": 500, "cache_read_tokens": 0, "cache_creation_tokens": 0}],
+}
 
-def test_sync_idempotent(client, api_key):
-    """Test that repeated syncs don't create duplicates."""
-    payload = {
-        "protocol_version": 1,
-        "hostname": "test-machine",
-        "daily_activity": [{"date": "2026-01-07", "message_count": 10, "session_count": 1, "tool_call_count": 5}],
-        "daily_usage": [{"date": "2026-01-07", "input_tokens": 500, "output_tokens": 500, "cache_read_tokens": 0, "cache_creation_tokens": 0}],
-        "model_usage": []
-    }
 
-    # First sync
-    r1 = client.post("/v1/sync", json=payload, headers={"X-API-Key": api_key})
-    assert r1.status_code == 200
+@pytest.mark.parametrize(
+    "hostname, with_records, syncs, key, expected_status, expected_registered",
+    [
+        # Fresh hostname, first sync registers the machine.
+        pytest.param("unique", False, 1, "valid", 200, True,
+                     id="creates-machine"),
+        # Same payload twice: second sync must not re-register.
+        pytest.param("test-machine", True, 2, "valid", 200, False,
+                     id="idempotent"),
+        # No API key header at all.
+        pytest.param("test-machine", False, 1, None, 401, None,
+                     id="requires-auth"),
+        # Wrong API key.
+        pytest.param("test-machine", False, 1, "wrong-key", 401, None,
+                     id="rejects-wrong-key"),
+    ],
+)
+async def test_sync(aclient, auth_headers, hostname, with_records, syncs, key,
+                    expected_status, expected_registered):
+    """Table-driven /v1/sync checks: registration, idempotency, auth."""
+    if hostname == "unique":
+        hostname = f"test-machine-{next(_hostname_counter)}"
+    payload = {**_BASE_PAYLOAD, "hostname": hostname}
+    if with_records:
+        payload.update(_DATA_RECORDS)
 
-    # Second sync (same data)
-    r2 = client.post("/v1/sync", json=payload, headers={"X-API-Key": api_key})
-    assert r2.status_code == 200
-    assert r2.json()["machine_registered"] is False
+    headers = {"Content-Type": "application/json"}
+    if key == "valid":
+        headers.update(auth_headers)
+    elif key is not None:
+        headers["X-API-Key"] = key
 
+    # Encode once; the idempotency case reposts the identical bytes.
+    body = _encode(payload)
+    # Sequential on purpose: the idempotency case asserts on the second
+    # response, so the posts must be ordered.
+    for _ in range(syncs):
+        response = await aclient.post("/v1/sync", content=body,
+                                      headers=headers)
 
-def test_sync_requires_auth(client):
-    """Test that sync requires API key."""
-    response = client.post("/v1/sync", json={"protocol_version": 1, "hostname": "x"})
-    assert response.status_code in [401, 403, 422]
+    assert response.status_code == expected_status
+    if expected_registered is not None:
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["machine_registered"] is expected_registered
 
 
-def test_sync_rejects_wrong_key(client):
-    """Test that wrong API key is rejected."""
-    response = client.post(
-        "/v1/sync",
-        json={
-            "protocol_version": 1,
-            "hostname": "test-machine",
-            "daily_activity": [],
-            "daily_usage": [],
-            "model_usage": []
-        },
-        headers={"X-API-Key": "wrong-key"}
+async def test_sync_concurrent_machines(aclient, auth_headers):
+    """Concurrent syncs for distinct machines all land cleanly."""
+    headers = {**auth_headers, "Content-Type": "application/json"}
+    bodies = [
+        _encode({**_BASE_PAYLOAD,
+                 "hostname": f"test-machine-{next(_hostname_counter)}"})
+        for _ in range(5)
+    ]
+    responses = await asyncio.gather(
+        *(aclient.post("/v1/sync", content=b, headers=headers)
+          for b in bodies)
     )
-    assert response.status_code == 401
+    for response in responses:
+        assert response.status_code == 200
+        assert response.json()["machine_registered"] is True